@@ -13,6 +13,7 @@ from typing import Optional, Dict, Any
 from fastapi import FastAPI, File, UploadFile, HTTPException, Form
 from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 import uvicorn
 from dotenv import load_dotenv
@@ -45,6 +46,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger responses (extracted JSON/CSV results) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Initialize core components (removed global instances to fix provider switching)
 # extractor = FinancialDataExtractor()  # REMOVED - causes singleton caching issue
 # pdf_processor = PDFProcessor(extractor)  # REMOVED
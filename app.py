@@ -10,8 +10,6 @@ import os
 from dotenv import load_dotenv
 # from openai import OpenAI  # No longer needed - using FinancialDataExtractor
 import time
-import chromadb
-from chromadb.config import Settings
 import numpy as np
 import fitz  # PyMuPDF
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -693,7 +691,7 @@ def display_single_page_data(data):
                     data=analysis_csv,
                     file_name=f"financial_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                     mime="text/csv",
-                    key=f"download_financial_csv_{abs(hash(str(data))) % 10000}"
+                    key=f"download_financial_csv_{id(data)}"
                 )
             else:
                 # Fallback to original format if analysis format fails
@@ -703,7 +701,7 @@ def display_single_page_data(data):
                     data=detailed_csv,
                     file_name=f"financial_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                     mime="text/csv",
-                    key=f"download_financial_csv_{abs(hash(str(data))) % 10000}"
+                    key=f"download_financial_csv_{id(data)}"
                 )
         
         with col2:
@@ -719,7 +717,7 @@ def display_single_page_data(data):
                     data=summary_csv,
                     file_name=f"financial_data_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                     mime="text/csv",
-                    key=f"download_summary_csv_{abs(hash(str(data))) % 10000}"
+                    key=f"download_summary_csv_{id(data)}"
                 )
         
         # Show data quality metrics
@@ -1215,6 +1213,12 @@ def extract_comprehensive_financial_data(base64_image, statement_type_hint, page
 def init_chromadb():
     """Initialize ChromaDB client with persistent storage"""
     try:
+        # Imported here rather than at module top: chromadb pulls in a large dependency
+        # tree, so only the vector database path pays for it (and a missing install is
+        # reported below instead of stopping the whole app)
+        import chromadb
+        from chromadb.config import Settings
+        
         # Option for financial-specific embeddings (can be enabled later)
         use_financial_embeddings = os.getenv("USE_FINANCIAL_EMBEDDINGS", "false").lower() == "true"
         
@@ -2362,20 +2366,33 @@ def validate_file_upload(uploaded_file):
     
     return True, "File is valid"
 
+# Display labels for the approach/recommendation keys used throughout the UI
+APPROACH_LABELS = {
+    'whole_document': 'Whole Document',
+    'vector_database': 'Vector Database',
+    'single_image': 'Single Image',
+    'user_choice': 'User Choice',
+}
+
+def format_approach_label(approach):
+    """Display label for a processing approach key, e.g. 'whole_document' -> 'Whole Document'"""
+    return APPROACH_LABELS.get(approach) or str(approach or "Unknown").replace('_', ' ').title()
+
+# Per-file processing state: the initial values, restored as one update by the reset buttons
+PROCESSING_STATE_DEFAULTS = {
+    'extracted_data': None,
+    'processing_complete': False,
+    'uploaded_file_name': None,
+    'processing_approach': None,
+    'selected_processing_approach': None,
+}
+
 def main():
     """Main application function with enhanced processing approaches"""
     
     # Initialize session state
-    if 'extracted_data' not in st.session_state:
-        st.session_state.extracted_data = None
-    if 'processing_complete' not in st.session_state:
-        st.session_state.processing_complete = False
-    if 'uploaded_file_name' not in st.session_state:
-        st.session_state.uploaded_file_name = None
-    if 'processing_approach' not in st.session_state:
-        st.session_state.processing_approach = None
-    if 'selected_processing_approach' not in st.session_state:
-        st.session_state.selected_processing_approach = None
+    for key, value in PROCESSING_STATE_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
     if 'debug_mode' not in st.session_state:
         st.session_state.debug_mode = False
     if 'show_onboarding' not in st.session_state:
@@ -2513,11 +2530,7 @@ def main():
         # Add clear results button
         if st.session_state.processing_complete:
             if st.button("🗑️ Clear Results", type="secondary"):
-                st.session_state.extracted_data = None
-                st.session_state.processing_complete = False
-                st.session_state.uploaded_file_name = None
-                st.session_state.processing_approach = None
-                st.session_state.selected_processing_approach = None
+                st.session_state.update(PROCESSING_STATE_DEFAULTS)
                 st.rerun()
         
         # Help and Support Section
@@ -2790,11 +2803,11 @@ def main():
                 reason = doc_analysis['reason']
                 
                 if confidence == "high":
-                    st.success(f"**Recommended:** {str(recommendation).replace('_', ' ').title()}")
+                    st.success(f"**Recommended:** {format_approach_label(recommendation)}")
                 elif confidence == "medium":
-                    st.info(f"**Suggested:** {str(recommendation).replace('_', ' ').title()}")
+                    st.info(f"**Suggested:** {format_approach_label(recommendation)}")
                 else:
-                    st.warning(f"**Option:** {str(recommendation).replace('_', ' ').title()}")
+                    st.warning(f"**Option:** {format_approach_label(recommendation)}")
                 
                 st.caption(reason)
         
@@ -2836,7 +2849,6 @@ def main():
                 
                 if st.button("🌐 Use Whole Document", type="secondary", key="whole_doc_btn"):
                     st.session_state.selected_processing_approach = "whole_document"
-                    st.rerun()
             
             with col2:
                 st.markdown("### 🗄️ Vector Database Analysis")
@@ -2859,17 +2871,18 @@ def main():
                 
                 if st.button("🗄️ Use Vector Database", type="secondary", key="vector_db_btn"):
                     st.session_state.selected_processing_approach = "vector_database"
-                    st.rerun()
         
-        # Show selected approach
+        # Show selected approach. A selection click above already triggered this run and
+        # everything below reads the updated state, so those buttons need no extra st.rerun()
         if st.session_state.selected_processing_approach:
-            approach_name = st.session_state.selected_processing_approach.replace('_', ' ').title()
+            approach_name = format_approach_label(st.session_state.selected_processing_approach)
             col1, col2 = st.columns([3, 1])
             with col1:
                 st.success(f"✅ Selected: {approach_name}")
             with col2:
                 if st.button("🔄 Change", key="change_approach"):
                     st.session_state.selected_processing_approach = None
+                    # The "Selected" banner above is already drawn for this run, so rerun to clear it
                     st.rerun()
         
         # Process button - show when approach is selected (for PDFs) or for non-PDF files
@@ -2882,13 +2895,16 @@ def main():
             processing_approach = st.session_state.selected_processing_approach
             show_button = processing_approach is not None
         
+        # Display form of the approach, as stored in st.session_state.processing_approach
+        approach_label = format_approach_label(processing_approach)
+        
         # Show process button if approach is selected or it's a single image
         if show_button:
             # Only disable if we already have results for this exact file and approach
             button_disabled = (
                 not is_new_file and 
                 st.session_state.processing_complete and 
-                st.session_state.processing_approach == str(processing_approach or "Unknown").replace('_', ' ').title()
+                st.session_state.processing_approach == approach_label
             )
             
             button_label = "🚀 Extract Financial Data"
@@ -2909,11 +2925,7 @@ def main():
                     
                     # Reset session state button for debugging
                     if st.button("🔄 Reset Session State", key="reset_session"):
-                        st.session_state.extracted_data = None
-                        st.session_state.processing_complete = False
-                        st.session_state.uploaded_file_name = None
-                        st.session_state.processing_approach = None
-                        st.session_state.selected_processing_approach = None
+                        st.session_state.update(PROCESSING_STATE_DEFAULTS)
                         st.success("Session state reset!")
                         st.rerun()
             
@@ -2925,7 +2937,7 @@ def main():
                     return
                 
                 # Clear previous results for new file or new approach
-                if is_new_file or st.session_state.processing_approach != str(processing_approach or "Unknown").replace('_', ' ').title():
+                if is_new_file or st.session_state.processing_approach != approach_label:
                     st.session_state.extracted_data = None
                     st.session_state.processing_complete = False
                     
@@ -2979,7 +2991,7 @@ def main():
                                 st.session_state.extracted_data = extracted_data
                                 st.session_state.processing_complete = True
                                 st.session_state.uploaded_file_name = uploaded_file.name
-                                st.session_state.processing_approach = str(processing_approach or "Unknown").replace('_', ' ').title()
+                                st.session_state.processing_approach = approach_label
                                 
                                 # Calculate confidence
                                 if isinstance(extracted_data, list):
@@ -3001,7 +3013,7 @@ def main():
                                 # Log processing
                                 log_processing(uploaded_file.name, processing_time, avg_confidence, "success")
                                 
-                                st.success(f"✅ Data extracted successfully in {processing_time:.1f} seconds using {str(processing_approach or 'Unknown').replace('_', ' ').title()} approach!")
+                                st.success(f"✅ Data extracted successfully in {processing_time:.1f} seconds using {approach_label} approach!")
                                 
                                 # Feedback collection
                                 st.markdown("---")
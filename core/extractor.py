@@ -47,9 +47,18 @@ class FinancialDataExtractor:
         
         print(f"[DEBUG] Extractor init - has anthropic client: {hasattr(self, 'anthropic_client') and self.anthropic_client is not None}")
         print(f"[DEBUG] Extractor init - has openai client: {hasattr(self, 'openai_client') and self.openai_client is not None}")
+        
+        # Template fields are static for the extractor's lifetime - loaded on first use
+        self._template_fields: Optional[List[str]] = None
     
     def _load_template_fields(self) -> List[str]:
-        """Load the 91 template fields for context"""
+        """Load the 91 template fields for context (read once per extractor)"""
+        if self._template_fields is None:
+            self._template_fields = self._read_template_fields()
+        return list(self._template_fields)
+    
+    def _read_template_fields(self) -> List[str]:
+        """Read the 91 template fields from the template CSV"""
         try:
             template_path = Path(__file__).parent / "templates" / "FS_Input_Template_Fields.csv"
             
@@ -403,7 +412,8 @@ IMPORTANT: Return years in descending order (newest to oldest). Extract ALL year
                     {
                         "role": "user",
                         "content": [
-                            {"type": "text", "text": prompt},
+                            # Prompts are reused across pages - cache them as a prefix
+                            {"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}},
                             {
                                 "type": "image",
                                 "source": {
@@ -416,6 +426,7 @@ IMPORTANT: Return years in descending order (newest to oldest). Extract ALL year
                     }
                 ]
             )
+            self._log_prompt_cache_usage(response, "Anthropic call")
             
             # Handle response from 2025 v4.2 API
             if hasattr(response, 'content') and response.content:
@@ -425,6 +436,22 @@ IMPORTANT: Return years in descending order (newest to oldest). Extract ALL year
 
         return self.exponential_backoff_retry(api_call)
 
+    @staticmethod
+    def _log_prompt_cache_usage(response, label: str) -> None:
+        """Log prompt-cache usage reported by Anthropic (short prompts are never cached)"""
+        usage = getattr(response, 'usage', None)
+        cache_read = getattr(usage, 'cache_read_input_tokens', None)
+        cache_written = getattr(usage, 'cache_creation_input_tokens', None)
+        if not isinstance(cache_read, int) or not isinstance(cache_written, int):
+            return  # Usage not reported
+        
+        if cache_read:
+            print(f"[CACHE] {label}: {cache_read} prompt tokens read from cache")
+        elif cache_written:
+            print(f"[CACHE] {label}: {cache_written} prompt tokens written to cache")
+        else:
+            print(f"[CACHE] {label}: prompt not cached (e.g. shorter than the model's minimum cacheable length)")
+
     def _call_text_only_api(self, prompt: str, system_message: str = None, temperature: float = 0.1, max_tokens: int = 4000) -> str:
         """
         Make a text-only API call (no images) - provider-agnostic.
@@ -496,12 +523,11 @@ IMPORTANT: Return years in descending order (newest to oldest). Extract ALL year
                 'image': base64_image
             })
 
-        # Create multi-image prompt
+        # Create multi-image prompt - the instructions are identical for every batch,
+        # so they go first as a cacheable prefix and only the page count varies
         multi_image_prompt = f"""
 {enhanced_prompt}
 
-Processing {len(page_images)} related pages from financial statement.
-
 For each extracted data point, include:
 - page_num: Which page the data was found on
 - field_name: The template field name
@@ -511,13 +537,14 @@ For each extracted data point, include:
 
 Return as JSON with extracted_data array containing objects with these fields.
 """
+        batch_context = f"Processing {len(page_images)} related pages from financial statement."
 
         if self.provider == "anthropic":
-            return self._call_anthropic_api_batch(page_images, multi_image_prompt)
+            return self._call_anthropic_api_batch(page_images, multi_image_prompt, batch_context)
         else:
-            return self._call_openai_api_batch(page_images, multi_image_prompt)
+            return self._call_openai_api_batch(page_images, multi_image_prompt, batch_context)
 
-    def _call_anthropic_api_batch(self, page_images: list, prompt: str) -> str:
+    def _call_anthropic_api_batch(self, page_images: list, prompt: str, batch_context: str = "") -> str:
         """Make batch API call to Anthropic with multiple images"""
 
         def api_call():
@@ -525,8 +552,10 @@ Return as JSON with extracted_data array containing objects with these fields.
             estimated_cost = len(page_images) * 0.15  # $0.15 per page estimate
             print(f"[COST] Anthropic batch call: {len(page_images)} pages, estimated ${estimated_cost:.2f}")
 
-            # Prepare content with multiple images
-            content = [{"type": "text", "text": prompt}]
+            # Prepare content with multiple images - static prompt is marked for prompt caching
+            content = [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
+            if batch_context:
+                content.append({"type": "text", "text": batch_context})
 
             for page_img in page_images:
                 content.append({
@@ -543,6 +572,7 @@ Return as JSON with extracted_data array containing objects with these fields.
                 max_tokens=self.config.ANTHROPIC_MAX_TOKENS,
                 messages=[{"role": "user", "content": content}]
             )
+            self._log_prompt_cache_usage(response, "Anthropic batch call")
 
             # Handle response from 2025 v4.2 API
             if hasattr(response, 'content') and response.content:
@@ -552,16 +582,19 @@ Return as JSON with extracted_data array containing objects with these fields.
 
         return self.exponential_backoff_retry(api_call)
 
-    def _call_openai_api_batch(self, page_images: list, prompt: str) -> str:
+    def _call_openai_api_batch(self, page_images: list, prompt: str, batch_context: str = "") -> str:
         """Make batch API call to OpenAI with multiple images"""
 
         def api_call():
             # Track cost for this batch call
             estimated_cost = len(page_images) * 0.12  # $0.12 per page estimate for OpenAI
-            print(f"[COST] OpenAI batch call: {len(page_images)} pages, estimated ${estimated_cost:.2f}")
+            print(f"[COST] OpenAI batch call: {len(page_images)} pages, estimated ${estimated_cost:.2f} "
+                  f"(static prompt {len(prompt.encode('utf-8'))} bytes)")
 
-            # Prepare content with multiple images
+            # Prepare content with multiple images - OpenAI caches the static prompt prefix automatically
             content = [{"type": "text", "text": prompt}]
+            if batch_context:
+                content.append({"type": "text", "text": batch_context})
 
             for page_img in page_images:
                 content.append({
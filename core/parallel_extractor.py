@@ -11,6 +11,9 @@ import threading
 from dataclasses import dataclass
 from collections import defaultdict
 
+# Requests per minute allowed for page classification calls
+CLASSIFICATION_RATE_LIMIT = 120
+
 
 @dataclass
 class ExtractionResult:
@@ -47,6 +50,23 @@ class RateLimiter:
         with self.lock:
             self.requests.append(time.time())
 
+    def acquire(self):
+        """Wait for a free slot and register the request in one step, so concurrent callers cannot overshoot"""
+        backoff = self.backoff_base
+
+        while True:
+            with self.lock:
+                now = time.time()
+                # Remove requests older than 1 minute
+                self.requests = [req_time for req_time in self.requests if now - req_time < 60]
+                if len(self.requests) < self.max_requests:
+                    self.requests.append(now)
+                    return
+                wait = 60 - (now - min(self.requests))
+
+            time.sleep(min(max(wait, backoff), self.max_backoff))
+            backoff = min(backoff * self.backoff_multiplier, self.max_backoff)
+
     def smart_wait_calculation(self) -> float:
         """Calculate optimal wait time based on request history"""
         with self.lock:
@@ -300,7 +320,7 @@ class ParallelExtractor:
 class ParallelClassifier:
     """Parallel classification optimization with rate limiting"""
 
-    def __init__(self, extractor, max_workers: int = 10, rate_limit: int = 120):
+    def __init__(self, extractor, max_workers: int = 10, rate_limit: int = CLASSIFICATION_RATE_LIMIT):
         """
         Initialize parallel classifier with optimized settings
 
@@ -5,20 +5,34 @@ Copied exactly from alpha-testing-v1 for optimal performance.
 
 import io
 import json
-import fitz  # PyMuPDF
+import sys
+from functools import cached_property
 from PIL import Image
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterable, Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from .extractor import FinancialDataExtractor
 from .config import Config
 
 
+class _AsciiTranslateTable(dict):
+    """str.translate table keeping ASCII and deleting other code points, cached on first sight"""
+
+    def __missing__(self, codepoint: int) -> None:
+        self[codepoint] = None
+        return None
+
+
+# Used to sanitize messages for Windows console encoding
+_ASCII_TRANSLATE = _AsciiTranslateTable((c, c) for c in range(128))
+
+
 class PDFProcessor:
     """PDF processing class for converting PDFs to images and extracting text"""
     
     def __init__(self, extractor: Optional[FinancialDataExtractor] = None):
         """Initialize PDF processor with optional extractor - NO WORK DONE IN INIT"""
-        self.extractor = extractor or FinancialDataExtractor()
+        if extractor is not None:
+            self.extractor = extractor
         self.config = Config()
         
         # Lazy initialization - no work done during import
@@ -27,6 +41,17 @@ class PDFProcessor:
         self.pdf_library = None
         self.pdf_error_message = None
     
+    @cached_property
+    def extractor(self) -> FinancialDataExtractor:
+        """Extractor used for AI calls - created on first use when none was injected"""
+        return FinancialDataExtractor()
+    
+    @cached_property
+    def classification_rate_limiter(self):
+        """Rate limiter shared by every vision classification call made through this processor"""
+        from .parallel_extractor import RateLimiter, CLASSIFICATION_RATE_LIMIT
+        return RateLimiter(CLASSIFICATION_RATE_LIMIT)
+    
     def _detect_backends(self):
         """Detect available PDF processing backends with timeout protection"""
         import os
@@ -98,6 +123,28 @@ class PDFProcessor:
         Returns:
             Tuple of (images, page_info)
         """
+        images = self._rasterize_pdf(pdf_file)
+        
+        try:
+            # Extract text from images using the same parallel processing as alpha-testing-v1
+            page_info = self._extract_text_from_images(images, enable_parallel)
+            
+            return images, page_info
+            
+        except Exception as e:
+            raise Exception(f"Error converting PDF to images: {str(e)}")
+    
+    def _rasterize_pdf(self, pdf_file) -> List[Image.Image]:
+        """
+        Convert PDF pages to images only, without the per-page text extraction.
+        Lets callers start API-bound work on the images while text extraction runs.
+        
+        Args:
+            pdf_file: PDF file (file path, file-like object or bytes)
+            
+        Returns:
+            List of PIL Images, one per page
+        """
         # Ensure backends are detected (lazy initialization)
         self._ensure_backends()
         
@@ -143,10 +190,7 @@ class PDFProcessor:
             else:
                 raise Exception("No PDF processing library available")
             
-            # Extract text from images using the same parallel processing as alpha-testing-v1
-            page_info = self._extract_text_from_images(images, enable_parallel)
-            
-            return images, page_info
+            return images
             
         except Exception as e:
             raise Exception(f"Error converting PDF to images: {str(e)}")
@@ -522,7 +566,7 @@ class PDFProcessor:
                 print(f"[INFO] Using RATE-LIMITED parallel classification: {page_count} pages")
 
                 try:
-                    from .parallel_extractor import ParallelClassifier
+                    from .parallel_extractor import ParallelClassifier, CLASSIFICATION_RATE_LIMIT
 
                     # Dynamic worker count based on document size
                     if page_count <= 20:
@@ -535,7 +579,7 @@ class PDFProcessor:
                     classifier = ParallelClassifier(
                         extractor=self.extractor,
                         max_workers=optimal_workers,
-                        rate_limit=120  # Conservative rate limit for classification
+                        rate_limit=CLASSIFICATION_RATE_LIMIT  # Conservative rate limit for classification
                     )
 
                     # Use rate-limited classification
@@ -667,13 +711,24 @@ class PDFProcessor:
         
         financial_pages = []
         
-        for i, page_image in enumerate(page_images):
+        # One limiter per processor, so repeated calls draw on the same per-minute budget
+        rate_limiter = self.classification_rate_limiter
+        
+        def _score_page(page_index, page_image):
+            """Encode and score a single page - designed for parallel execution"""
+            base64_image = self.extractor.encode_image(page_image)
+            rate_limiter.acquire()
+            return self._classify_page_four_scores(base64_image, page_num=page_index + 1)
+        
+        # Each page is an independent API call, so score them concurrently and read results back in page order
+        max_workers = max(1, min(self.config.PARALLEL_WORKERS, len(page_images)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            score_futures = [executor.submit(_score_page, i, page_image) for i, page_image in enumerate(page_images)]
+        
+        for i, (page_image, future) in enumerate(zip(page_images, score_futures)):
             try:
-                # Convert PIL image to base64
-                base64_image = self.extractor.encode_image(page_image)
-                
                 # Get four scores for this page
-                scores = self._classify_page_four_scores(base64_image)
+                scores = future.result()
                 
                 # Determine if this page should be included
                 max_score = max(scores['balance_sheet'], scores['income_statement'], scores['cash_flow'], scores['equity_statement'])
@@ -708,26 +763,29 @@ class PDFProcessor:
         print(f"[INFO] Four-score classification complete: {len(financial_pages)} financial pages identified")
         return financial_pages
     
-    def _classify_page_four_scores(self, base64_image: str) -> Dict[str, int]:
+    def _classify_page_four_scores(self, base64_image: str, page_num: Optional[int] = None) -> Dict[str, int]:
         """
         Classify a single page and return four scores (Balance Sheet, Income Statement, Cash Flow, Equity Statement)
         
         Args:
             base64_image: Base64-encoded page image
+            page_num: Optional 1-based page number used to label log lines
             
         Returns:
             Dict with balance_sheet, income_statement, cash_flow, equity_statement scores (0-100)
         """
         prompt = self._build_four_score_classification_prompt()
+        # Pages may be scored concurrently, so say which page each log line is about
+        label = f"Page {page_num} " if page_num is not None else ""
         
         try:
             result = self.extractor._call_anthropic_api(base64_image, prompt)
             
             # Debug: Show raw API response
-            print(f"[DEBUG] Raw API response: '{result[:200]}...' (length: {len(result)})")
+            print(f"[DEBUG] {label}Raw API response: '{result[:200]}...' (length: {len(result)})")
             
             if not result or result.strip() == "":
-                print(f"[WARN] Empty API response")
+                print(f"[WARN] {label}Empty API response")
                 return {'balance_sheet': 0, 'income_statement': 0, 'cash_flow': 0, 'equity_statement': 0}
             
             # Parse the JSON response
@@ -743,12 +801,12 @@ class PDFProcessor:
             return scores
             
         except json.JSONDecodeError as e:
-            print(f"[WARN] JSON decode error: {e}")
-            print(f"[WARN] Raw response: '{result[:500]}'")
+            print(f"[WARN] {label}JSON decode error: {e}")
+            print(f"[WARN] {label}Raw response: '{result[:500]}'")
             return {'balance_sheet': 0, 'income_statement': 0, 'cash_flow': 0, 'equity_statement': 0}
         except Exception as e:
-            print(f"[WARN] Failed to parse classification scores: {e}")
-            print(f"[WARN] Raw response: '{result[:500] if 'result' in locals() else 'No response'}'")
+            print(f"[WARN] {label}Failed to parse classification scores: {e}")
+            print(f"[WARN] {label}Raw response: '{result[:500] if 'result' in locals() else 'No response'}'")
             return {'balance_sheet': 0, 'income_statement': 0, 'cash_flow': 0, 'equity_statement': 0}
     
     def _build_four_score_classification_prompt(self) -> str:
@@ -841,12 +899,13 @@ RESPOND WITH ONLY THIS JSON ARRAY FORMAT (one object per image, in order):
     {{"balance_sheet": X{num_images}, "income_statement": Y{num_images}, "cash_flow": Z{num_images}, "equity_statement": W{num_images}}}
 ]"""
     
-    def classify_pages_with_vision_batch(self, page_images: List[Image.Image]) -> List[Dict[str, Any]]:
+    def classify_pages_with_vision_batch(self, page_images: List[Image.Image], batch_size: int = 5) -> List[Dict[str, Any]]:
         """
         Classify pages using four-score vision-based system with BATCH processing (4-5 pages per API call)
         
         Args:
             page_images: List of PIL Image objects for each page
+            batch_size: Number of pages sent per API call
             
         Returns:
             List of financial pages with statement type and confidence scores
@@ -855,7 +914,6 @@ RESPOND WITH ONLY THIS JSON ARRAY FORMAT (one object per image, in order):
         
         financial_pages = []
         page_count = len(page_images)
-        batch_size = 5  # Send 5 pages per API call
         batches = []
         
         # Create batches of page images
@@ -1015,12 +1073,12 @@ RESPOND WITH ONLY THIS JSON ARRAY FORMAT (one object per image, in order):
             # Return default scores for all images
             return [{'balance_sheet': 0, 'income_statement': 0, 'cash_flow': 0, 'equity_statement': 0} for _ in range(num_images)]
     
-    def _extract_years_from_financial_pages(self, page_images: List[Image.Image], financial_pages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _extract_years_from_financial_pages(self, page_images: Union[List[Image.Image], Dict[int, Image.Image]], financial_pages: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Extract years from identified financial pages (not hardcoded pages)
         
         Args:
-            page_images: All page images
+            page_images: All page images, as a list indexed by page number or a dict keyed by page number
             financial_pages: List of identified financial pages with statement types
             
         Returns:
@@ -1043,11 +1101,12 @@ RESPOND WITH ONLY THIS JSON ARRAY FORMAT (one object per image, in order):
                 print(f"[INFO] Extracting years from page {page_num + 1} ({statement_type})...")
                 
                 try:
+                    page_image = page_images.get(page_num) if isinstance(page_images, dict) else page_images[page_num]
                     # Skip if page image is None
-                    if page_images[page_num] is None:
+                    if page_image is None:
                         continue
                     # Convert PIL image to base64 for year extraction
-                    base64_image = self.extractor.encode_image(page_images[page_num])
+                    base64_image = self.extractor.encode_image(page_image)
                     page_years = self.extractor.extract_years_from_image(base64_image)
                     if page_years.get('years'):
                         all_years.update(page_years['years'])
@@ -1454,15 +1513,7 @@ RESPOND WITH ONLY THIS JSON ARRAY FORMAT (one object per image, in order):
             if year_data and year_data.get('years'):
                 years = year_data['years']
                 # Add Year field with all year values
-                combined_data['template_mappings']['Year'] = {
-                    'value': years[0] if years else None,
-                    'confidence': year_data.get('confidence', 0.95),
-                    'Value_Year_1': years[0] if len(years) > 0 else None,
-                    'Value_Year_2': years[1] if len(years) > 1 else None,
-                    'Value_Year_3': years[2] if len(years) > 2 else None,
-                    'Value_Year_4': years[3] if len(years) > 3 else None,
-                    'source': year_data.get('source', 'vision_extraction')
-                }
+                combined_data['template_mappings']['Year'] = self._build_year_mapping(year_data)
                 print(f"[INFO] Year field populated: {years}")
             else:
                 print(f"[WARN] No year data to add to results")
@@ -1478,6 +1529,24 @@ RESPOND WITH ONLY THIS JSON ARRAY FORMAT (one object per image, in order):
         except Exception as e:
             raise Exception(f"Error processing PDF: {str(e)}")
     
+    def _build_year_mapping(self, year_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the Year template mapping from extracted year data.
+        
+        Args:
+            year_data: Dict with years (most recent first), confidence, and source
+            
+        Returns:
+            Year mapping with value and Value_Year_1..4 columns (None when missing)
+        """
+        padded = (list(year_data['years']) + [None] * 4)[:4]
+        return {
+            'value': padded[0],
+            'confidence': year_data.get('confidence', 0.95),
+            **{f'Value_Year_{i + 1}': year for i, year in enumerate(padded)},
+            'source': year_data.get('source', 'vision_extraction')
+        }
+    
     def _combine_page_results(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Combine results from multiple pages into a single result.
@@ -1720,15 +1789,8 @@ RESPOND WITH ONLY THIS JSON ARRAY FORMAT (one object per image, in order):
 
         try:
             # Phase 0: Extract years from financial pages (before batch processing)
-            # Build page_images list indexed by page_num for _extract_years_from_financial_pages
-            # Find max page_num to size the array correctly
-            max_page_num = max((page.get('page_num', 0) for page in selected_pages), default=0)
-            page_images = [None] * (max_page_num + 1)
-            
-            for page in selected_pages:
-                page_num = page.get('page_num', 0)
-                if 'image' in page:
-                    page_images[page_num] = page['image']
+            # Build page_images dict keyed by page_num for _extract_years_from_financial_pages
+            page_images = {page.get('page_num', 0): page['image'] for page in selected_pages if 'image' in page}
             
             # Extract years from identified financial pages
             print("[INFO] Extracting years from financial pages...")
@@ -1758,54 +1820,59 @@ RESPOND WITH ONLY THIS JSON ARRAY FORMAT (one object per image, in order):
 
                 batch_result = batch_extractor.extract_batch(batch)
                 if batch_result and batch_result.get('extracted_data'):
-                    # Convert batch result format to expected format
-                    batch_extracted_data = batch_result['extracted_data']
-                    statement_type = batch_result.get('statement_type', 'unknown')
-                    print(f"[DEBUG] Batch {batch['batch_id']}: Got {len(batch_extracted_data)} extracted items")
+                    # Buffer per-item diagnostics and emit them in one write per batch
+                    log_lines = []
+                    try:
+                        # Convert batch result format to expected format
+                        batch_extracted_data = batch_result['extracted_data']
+                        statement_type = batch_result.get('statement_type', 'unknown')
+                        log_lines.append(f"[DEBUG] Batch {batch['batch_id']}: Got {len(batch_extracted_data)} extracted items\n")
                     
-                    # Group extracted items by page_num
-                    pages_data = {}
-                    for item in batch_extracted_data:
-                        page_num = item.get('page_num', 0)
-                        if page_num not in pages_data:
-                            pages_data[page_num] = {
-                                'template_mappings': {}
-                            }
+                        # Group extracted items by page_num
+                        pages_data = {}
+                        for item in batch_extracted_data:
+                            page_num = item.get('page_num', 0)
+                            if page_num not in pages_data:
+                                pages_data[page_num] = {
+                                    'template_mappings': {}
+                                }
                         
-                        # Convert item to template_mapping format (no normalization - prompt fixed)
-                        field_name = item.get('field_name', '')
-                        if field_name:
-                            # Collect field name for analysis
-                            all_field_names.add(field_name)
+                            # Convert item to template_mapping format (no normalization - prompt fixed)
+                            field_name = item.get('field_name', '')
+                            if field_name:
+                                # Collect field name for analysis
+                                all_field_names.add(field_name)
                             
-                            # Use field name directly from batch extraction (LLM should return exact template field names)
-                            value = item.get('value', '')
-                            year = item.get('year', 'N/A')
-                            confidence = item.get('confidence', 0.0)
+                                # Use field name directly from batch extraction (LLM should return exact template field names)
+                                value = item.get('value', '')
+                                year = item.get('year', 'N/A')
+                                confidence = item.get('confidence', 0.0)
                             
-                            print(f"[FIELD_MAP] Page {page_num}: '{field_name}' = {value} (Year: {year}, Confidence: {confidence:.2f})")
+                                log_lines.append(f"[FIELD_MAP] Page {page_num}: '{field_name}' = {value} (Year: {year}, Confidence: {confidence:.2f})\n")
                             
-                            # Use field name directly (should already be template field name from improved prompt)
-                            pages_data[page_num]['template_mappings'][field_name] = {
-                                'value': value,
-                                'confidence': confidence,
-                                'year': year,
-                                'page_num': page_num
-                            }
-                        else:
-                            print(f"[WARN] Item missing 'field_name' on page {page_num}: {list(item.keys())}")
+                                # Use field name directly (should already be template field name from improved prompt)
+                                pages_data[page_num]['template_mappings'][field_name] = {
+                                    'value': value,
+                                    'confidence': confidence,
+                                    'year': year,
+                                    'page_num': page_num
+                                }
+                            else:
+                                log_lines.append(f"[WARN] Item missing 'field_name' on page {page_num}: {list(item.keys())}\n")
                     
-                    print(f"[DEBUG] Batch {batch['batch_id']}: Grouped into {len(pages_data)} pages with template_mappings")
+                        log_lines.append(f"[DEBUG] Batch {batch['batch_id']}: Grouped into {len(pages_data)} pages with template_mappings\n")
                     
-                    # Convert to expected format for convert_batch_results_to_standard_format
-                    for page_num, page_data in pages_data.items():
-                        all_results.append({
-                            'page_num': page_num,
-                            'statement_type': statement_type,
-                            'data': page_data
-                        })
+                        # Convert to expected format for convert_batch_results_to_standard_format
+                        for page_num, page_data in pages_data.items():
+                            all_results.append({
+                                'page_num': page_num,
+                                'statement_type': statement_type,
+                                'data': page_data
+                            })
                     
-                    print(f"[DEBUG] Batch {batch['batch_id']}: Added {len(pages_data)} results to all_results (total: {len(all_results)})")
+                        log_lines.append(f"[DEBUG] Batch {batch['batch_id']}: Added {len(pages_data)} results to all_results (total: {len(all_results)})\n")
+                    finally:
+                        sys.stdout.writelines(log_lines)
 
                 # Cost monitoring
                 total_cost = batch_extractor.total_cost
@@ -1814,75 +1881,76 @@ RESPOND WITH ONLY THIS JSON ARRAY FORMAT (one object per image, in order):
                     break
 
             # Phase 3: Structure results for existing pipeline
-            print(f"[DEBUG] Total all_results before conversion: {len(all_results)}")
-            
-            # Log all unique field names found for mapping analysis
-            if all_field_names:
-                print(f"\n[FIELD_MAP] ========================================")
-                print(f"[FIELD_MAP] FIELD NAME MAPPING ANALYSIS")
-                print(f"[FIELD_MAP] ========================================")
-                print(f"[FIELD_MAP] Total unique field names extracted: {len(all_field_names)}")
-                print(f"[FIELD_MAP] Field names (sorted):")
-                for field_name in sorted(all_field_names):
-                    print(f"[FIELD_MAP]   - '{field_name}'")
-                print(f"[FIELD_MAP] ========================================\n")
-            
-            if all_results:
-                print(f"[DEBUG] First result structure: {list(all_results[0].keys()) if isinstance(all_results[0], dict) else type(all_results[0])}")
-                if isinstance(all_results[0], dict) and 'data' in all_results[0]:
-                    print(f"[DEBUG] First result data keys: {list(all_results[0]['data'].keys())}")
-                    if 'template_mappings' in all_results[0]['data']:
-                        print(f"[DEBUG] First result template_mappings count: {len(all_results[0]['data']['template_mappings'])}")
+            log_lines = []
+            try:
+                log_lines.append(f"[DEBUG] Total all_results before conversion: {len(all_results)}\n")
+            
+                # Log all unique field names found for mapping analysis
+                if all_field_names:
+                    log_lines.append(f"\n[FIELD_MAP] ========================================\n")
+                    log_lines.append(f"[FIELD_MAP] FIELD NAME MAPPING ANALYSIS\n")
+                    log_lines.append(f"[FIELD_MAP] ========================================\n")
+                    log_lines.append(f"[FIELD_MAP] Total unique field names extracted: {len(all_field_names)}\n")
+                    log_lines.append(f"[FIELD_MAP] Field names (sorted):\n")
+                    for field_name in sorted(all_field_names):
+                        log_lines.append(f"[FIELD_MAP]   - '{field_name}'\n")
+                    log_lines.append(f"[FIELD_MAP] ========================================\n\n")
+            
+                if all_results:
+                    log_lines.append(f"[DEBUG] First result structure: {list(all_results[0].keys()) if isinstance(all_results[0], dict) else type(all_results[0])}\n")
+                    if isinstance(all_results[0], dict) and 'data' in all_results[0]:
+                        log_lines.append(f"[DEBUG] First result data keys: {list(all_results[0]['data'].keys())}\n")
+                        if 'template_mappings' in all_results[0]['data']:
+                            log_lines.append(f"[DEBUG] First result template_mappings count: {len(all_results[0]['data']['template_mappings'])}\n")
+            
+            finally:
+                sys.stdout.writelines(log_lines)
             
             # Use _combine_page_results() to combine into single dict with template_mappings
             converted_results = self._combine_page_results(all_results)
-            print(f"[DEBUG] Conversion complete - return type: {type(converted_results)}")
-            print(f"[DEBUG] Conversion complete - return keys: {list(converted_results.keys()) if isinstance(converted_results, dict) else 'Not a dict'}")
-            if isinstance(converted_results, dict) and 'template_mappings' in converted_results:
-                print(f"[DEBUG] Conversion complete - template_mappings count: {len(converted_results['template_mappings'])}")
-            
-            # Add year data to combined results (matching process_pdf_with_vector_db behavior)
-            if isinstance(converted_results, dict) and year_data and year_data.get('years'):
-                years = year_data['years']
-                # Ensure template_mappings exists
-                if 'template_mappings' not in converted_results:
-                    converted_results['template_mappings'] = {}
-                # Add Year field with all year values
-                converted_results['template_mappings']['Year'] = {
-                    'value': years[0] if years else None,
-                    'confidence': year_data.get('confidence', 0.95),
-                    'Value_Year_1': years[0] if len(years) > 0 else None,
-                    'Value_Year_2': years[1] if len(years) > 1 else None,
-                    'Value_Year_3': years[2] if len(years) > 2 else None,
-                    'Value_Year_4': years[3] if len(years) > 3 else None,
-                    'source': year_data.get('source', 'vision_extraction')
-                }
-                print(f"[INFO] Year field populated: {years}")
-            elif isinstance(converted_results, dict):
-                print(f"[WARN] No year data to add to results (year_data: {year_data})")
-            
-            # Add cost metadata to return value (Phase 2: Cost Tracking)
-            if isinstance(converted_results, dict):
-                # Capture cost information from batch_extractor
-                total_cost = batch_extractor.total_cost if 'batch_extractor' in locals() else 0.0
-                total_batches = len(processing_batches) if 'processing_batches' in locals() else 0
-                total_pages = len(selected_pages)
+            is_dict = isinstance(converted_results, dict)
+            log_lines = []
+            try:
+                log_lines.append(f"[DEBUG] Conversion complete - return type: {type(converted_results)}\n")
+                log_lines.append(f"[DEBUG] Conversion complete - return keys: {list(converted_results.keys()) if is_dict else 'Not a dict'}\n")
+
+                if is_dict:
+                    # Ensure template_mappings exists and bind it once for the updates below
+                    template_mappings = converted_results.setdefault('template_mappings', {})
+                    log_lines.append(f"[DEBUG] Conversion complete - template_mappings count: {len(template_mappings)}\n")
+
+                    # Add year data to combined results (matching process_pdf_with_vector_db behavior)
+                    if year_data and year_data.get('years'):
+                        years = year_data['years']
+                        # Add Year field with all year values
+                        template_mappings['Year'] = self._build_year_mapping(year_data)
+                        log_lines.append(f"[INFO] Year field populated: {years}\n")
+                    else:
+                        log_lines.append(f"[WARN] No year data to add to results (year_data: {year_data})\n")
+
+                    # Add cost metadata to return value (Phase 2: Cost Tracking)
+                    # Capture cost information from batch_extractor
+                    total_cost = batch_extractor.total_cost
+                    total_batches = len(processing_batches)
+                    total_pages = len(selected_pages)
                 
-                converted_results['batch_processing_metadata'] = {
-                    'total_batches': total_batches,
-                    'total_pages': total_pages,
-                    'total_cost': total_cost,
-                    'cost_per_page': total_cost / total_pages if total_pages > 0 else 0.0,
-                    'api_calls': total_batches,  # Each batch is one API call
-                    'processing_method': 'batch_extraction'
-                }
-                print(f"[INFO] Cost metadata added: ${total_cost:.2f} for {total_batches} batches, {total_pages} pages")
+                    converted_results['batch_processing_metadata'] = {
+                        'total_batches': total_batches,
+                        'total_pages': total_pages,
+                        'total_cost': total_cost,
+                        'cost_per_page': total_cost / total_pages if total_pages > 0 else 0.0,
+                        'api_calls': total_batches,  # Each batch is one API call
+                        'processing_method': 'batch_extraction'
+                    }
+                    log_lines.append(f"[INFO] Cost metadata added: ${total_cost:.2f} for {total_batches} batches, {total_pages} pages\n")
             
+            finally:
+                sys.stdout.writelines(log_lines)
             return converted_results
 
         except Exception as e:
             # Sanitize error message for Windows console encoding
-            error_msg = str(e).encode('ascii', errors='ignore').decode('ascii')
+            error_msg = str(e).translate(_ASCII_TRANSLATE)
             print(f"[ERROR] Batch extraction failed: {error_msg}")
             print("[INFO] Falling back to sequential processing")
             return self.process_pages_sequentially(selected_pages)
@@ -1909,14 +1977,11 @@ RESPOND WITH ONLY THIS JSON ARRAY FORMAT (one object per image, in order):
             
             # Handle legacy list format
             elif isinstance(batch_results, list):
-                for result in batch_results:
-                    if isinstance(result, dict) and 'processing_metadata' in result:
-                        metadata = result['processing_metadata']
-                        cost = metadata.get('cost', 0)
-                        pages = metadata.get('pages_processed', [])
-                        total_cost += cost
-                        total_pages += len(pages)
-                        total_batches += 1
+                metas = [result['processing_metadata'] for result in batch_results
+                         if isinstance(result, dict) and 'processing_metadata' in result]
+                total_cost = sum(metadata.get('cost', 0) for metadata in metas)
+                total_pages = sum(len(metadata.get('pages_processed', ())) for metadata in metas)
+                total_batches = len(metas)
 
             print(f"\n[COST SUMMARY]")
             print(f"[COST SUMMARY] Batch Processing Results:")
@@ -1935,32 +2000,29 @@ RESPOND WITH ONLY THIS JSON ARRAY FORMAT (one object per image, in order):
 
     def convert_batch_results_to_standard_format(self, batch_results: list) -> list:
         """Convert batch results to match existing pipeline format"""
-        standard_results = []
-
-        for result in batch_results:
-            # Ensure compatibility with existing result processing
-            standard_result = {
-                'page_num': result.get('page_num', 0),
-                'extracted_data': result.get('extracted_data', {}),
-                'confidence': result.get('confidence', 0.0),
-                'statement_type': result.get('statement_type', 'unknown'),
-                'batch_processed': True  # Flag to indicate batch processing
-            }
-            standard_results.append(standard_result)
-
-        return standard_results
+        return [self._to_standard_result(result) for result in batch_results]
+
+    def iter_standard_format(self, batch_results: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Lazily convert batch results to the existing pipeline format, for callers that stream them"""
+        return (self._to_standard_result(result) for result in batch_results)
+
+    @staticmethod
+    def _to_standard_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """Ensure compatibility of a single batch result with existing result processing"""
+        return {
+            'page_num': result.get('page_num', 0),
+            'extracted_data': result.get('extracted_data', {}),
+            'confidence': result.get('confidence', 0.0),
+            'statement_type': result.get('statement_type', 'unknown'),
+            'batch_processed': True  # Flag to indicate batch processing
+        }
 
     def process_pages_sequentially(self, selected_pages: list) -> list:
         """Fallback sequential processing for small documents or when batch fails"""
         print(f"[INFO] 📄 Using sequential extraction for {len(selected_pages)} pages")
         
         # Extract years from financial pages before processing
-        max_page_num = max((page.get('page_num', 0) for page in selected_pages), default=0)
-        page_images = [None] * (max_page_num + 1)
-        for page in selected_pages:
-            page_num = page.get('page_num', 0)
-            if 'image' in page:
-                page_images[page_num] = page['image']
+        page_images = {page.get('page_num', 0): page['image'] for page in selected_pages if 'image' in page}
         
         print("[INFO] Extracting years from financial pages...")
         year_data = self._extract_years_from_financial_pages(page_images, selected_pages)
@@ -5,36 +5,53 @@ Progressive diagnostic script to find exactly where the hang occurs
 
 import os
 import sys
+import json
+import subprocess
 import time
-import threading
 from pathlib import Path
 
+# Probes run from the project root so `core` is importable regardless of the caller's cwd
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+# Set DIAG_PROFILE=1 to profile main() and each probe interpreter with cProfile
+PROFILE = bool(os.environ.get("DIAG_PROFILE"))
+
+# Probes do their work in a child process, so each child profiles itself and reports on stderr
+PROFILED_PROBE = """
+import cProfile, pstats, sys
+_profiler = cProfile.Profile()
+_profiler.enable()
+try:
+    exec(compile({snippet!r}, "<probe>", "exec"))
+finally:
+    _profiler.disable()
+    pstats.Stats(_profiler, stream=sys.stderr).sort_stats("cumulative").print_stats(40)
+"""
 
-def run_with_timeout(func, timeout_seconds=30, description="operation"):
-    """Run a function with timeout protection using threading"""
-    result = [None]
-    exception = [None]
-    
-    def target():
-        try:
-            result[0] = func()
-        except Exception as e:
-            exception[0] = e
-    
-    thread = threading.Thread(target=target)
-    thread.daemon = True
-    thread.start()
-    thread.join(timeout=timeout_seconds)
+
+def run_probe(snippet, timeout_seconds=30, description="operation"):
+    """Run a code snippet in a fresh interpreter so a hung probe can be killed outright"""
+    if PROFILE:
+        snippet = PROFILED_PROBE.format(snippet=snippet)
     
-    if thread.is_alive():
+    try:
+        result = subprocess.run(
+            [sys.executable, "-c", snippet],
+            capture_output=True, text=True, timeout=timeout_seconds, cwd=PROJECT_ROOT
+        )
+    except subprocess.TimeoutExpired:
         print(f"   ❌ {description} TIMED OUT after {timeout_seconds}s")
         return None
-    elif exception[0]:
-        print(f"   ❌ {description} FAILED: {exception[0]}")
+    
+    if result.returncode != 0:
+        error_lines = result.stderr.strip().splitlines()
+        print(f"   ❌ {description} FAILED: {error_lines[-1] if error_lines else f'exit code {result.returncode}'}")
         return None
-    else:
-        print(f"   ✅ {description} SUCCEEDED")
-        return result[0]
+    
+    print(f"   ✅ {description} SUCCEEDED")
+    if PROFILE:
+        print(result.stderr)
+    return result.stdout.strip()
 
 
 def test_basic_imports():
@@ -42,36 +59,23 @@ def test_basic_imports():
     print("\n🔍 TEST 1: Basic imports")
     print("-" * 40)
     
-    def test_os():
-        import os
-        return True
-    
-    def test_sys():
-        import sys
-        return True
-    
-    def test_json():
-        import json
-        return True
-    
-    def test_pathlib():
-        from pathlib import Path
-        return True
-    
-    def test_threading():
-        import threading
-        return True
-    
-    tests = [
-        (test_os, "os import"),
-        (test_sys, "sys import"),
-        (test_json, "json import"),
-        (test_pathlib, "pathlib import"),
-        (test_threading, "threading import")
-    ]
+    # One interpreter checks every module and reports a {name: ok} map
+    import_modules = """
+import importlib, json
+status = {}
+for name in ("os", "sys", "json", "pathlib", "threading"):
+    try:
+        importlib.import_module(name)
+        status[name] = True
+    except Exception:
+        status[name] = False
+print(json.dumps(status))
+"""
     
-    for test_func, description in tests:
-        run_with_timeout(test_func, 5, description)
+    result = run_probe(import_modules, 5, "basic imports")
+    if result:
+        for name, ok in json.loads(result).items():
+            print(f"   {'✅' if ok else '❌'} {name} import")
 
 
 def test_project_structure():
@@ -79,23 +83,24 @@ def test_project_structure():
     print("\n🔍 TEST 2: Project structure")
     print("-" * 40)
     
-    def check_core_dir():
-        core_dir = Path("core")
-        if core_dir.exists():
-            return f"core/ exists: {list(core_dir.glob('*.py'))}"
-        return "core/ does not exist"
-    
-    def check_tests_dir():
-        tests_dir = Path("tests")
-        if tests_dir.exists():
-            return f"tests/ exists: {list(tests_dir.glob('*.py'))}"
-        return "tests/ does not exist"
+    # Report a count and a short sample rather than every path in the directory
+    check_dir = """
+import os
+try:
+    with os.scandir({name!r}) as entries:
+        py_files = [entry.name for entry in entries if entry.name.endswith(".py")]
+    print(f"{name}/ exists: {{len(py_files)}} .py files, sample={{py_files[:10]}}")
+except FileNotFoundError:
+    print("{name}/ does not exist")
+"""
+    check_core_dir = check_dir.format(name="core")
+    check_tests_dir = check_dir.format(name="tests")
     
-    result1 = run_with_timeout(check_core_dir, 5, "core directory check")
+    result1 = run_probe(check_core_dir, 5, "core directory check")
     if result1:
         print(f"   📁 {result1}")
     
-    result2 = run_with_timeout(check_tests_dir, 5, "tests directory check")
+    result2 = run_probe(check_tests_dir, 5, "tests directory check")
     if result2:
         print(f"   📁 {result2}")
 
@@ -105,11 +110,9 @@ def test_core_package():
     print("\n🔍 TEST 3: Core package import")
     print("-" * 40)
     
-    def import_core():
-        import core
-        return f"core module: {dir(core)}"
+    import_core = "import core; print(f'core module: {dir(core)}')"
     
-    result = run_with_timeout(import_core, 10, "core package import")
+    result = run_probe(import_core, 10, "core package import")
     if result:
         print(f"   📦 {result}")
 
@@ -119,11 +122,9 @@ def test_config_module():
     print("\n🔍 TEST 4: Config module import")
     print("-" * 40)
     
-    def import_config_module():
-        from core import config
-        return f"config module: {dir(config)}"
+    import_config_module = "from core import config; print(f'config module: {dir(config)}')"
     
-    result = run_with_timeout(import_config_module, 10, "config module import")
+    result = run_probe(import_config_module, 10, "config module import")
     if result:
         print(f"   ⚙️ {result}")
 
@@ -133,11 +134,9 @@ def test_config_class():
     print("\n🔍 TEST 5: Config class import")
     print("-" * 40)
     
-    def import_config_class():
-        from core.config import Config
-        return f"Config class: {Config.__name__}"
+    import_config_class = "from core.config import Config; print(f'Config class: {Config.__name__}')"
     
-    result = run_with_timeout(import_config_class, 10, "Config class import")
+    result = run_probe(import_config_class, 10, "Config class import")
     if result:
         print(f"   🏗️ {result}")
 
@@ -147,12 +146,9 @@ def test_config_instantiation():
     print("\n🔍 TEST 6: Config instantiation")
     print("-" * 40)
     
-    def instantiate_config():
-        from core.config import Config
-        config = Config()
-        return f"Config instance: {type(config).__name__}"
+    instantiate_config = "from core.config import Config; config = Config(); print(f'Config instance: {type(config).__name__}')"
     
-    result = run_with_timeout(instantiate_config, 30, "Config instantiation")
+    result = run_probe(instantiate_config, 30, "Config instantiation")
     if result:
         print(f"   🎯 {result}")
 
@@ -162,11 +158,12 @@ def test_extractor_import():
     print("\n🔍 TEST 7: Extractor import")
     print("-" * 40)
     
-    def import_extractor():
-        from core.extractor import FinancialDataExtractor
-        return f"FinancialDataExtractor class: {FinancialDataExtractor.__name__}"
+    import_extractor = (
+        "from core.extractor import FinancialDataExtractor; "
+        "print(f'FinancialDataExtractor class: {FinancialDataExtractor.__name__}')"
+    )
     
-    result = run_with_timeout(import_extractor, 30, "FinancialDataExtractor import")
+    result = run_probe(import_extractor, 30, "FinancialDataExtractor import")
     if result:
         print(f"   🤖 {result}")
 
@@ -176,14 +173,15 @@ def test_extractor_instantiation():
     print("\n🔍 TEST 8: Extractor instantiation")
     print("-" * 40)
     
-    def instantiate_extractor():
-        from core.extractor import FinancialDataExtractor
-        extractor = FinancialDataExtractor()
-        return f"Extractor instance: {type(extractor).__name__}"
+    # The extractor prints its own init diagnostics - report only the last line
+    instantiate_extractor = (
+        "from core.extractor import FinancialDataExtractor; extractor = FinancialDataExtractor(); "
+        "print(f'Extractor instance: {type(extractor).__name__}')"
+    )
     
-    result = run_with_timeout(instantiate_extractor, 60, "FinancialDataExtractor instantiation")
+    result = run_probe(instantiate_extractor, 60, "FinancialDataExtractor instantiation")
     if result:
-        print(f"   🎯 {result}")
+        print(f"   🎯 {result.splitlines()[-1]}")
 
 
 def main():
@@ -216,4 +214,16 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if PROFILE:
+        import cProfile
+        import pstats
+        
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            main()
+        finally:
+            profiler.disable()
+            pstats.Stats(profiler).sort_stats("cumulative").print_stats(40)
+    else:
+        main()
@@ -6,7 +6,9 @@ This script tests each component individually to isolate the problem.
 
 import sys
 import os
+import shutil
 import subprocess
+import tempfile
 import time
 from pathlib import Path
 
@@ -27,18 +29,12 @@ def test_poppler_installation():
     poppler_found = []
     
     for binary in poppler_binaries:
-        try:
-            result = subprocess.run(['where', binary], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                poppler_found.append(binary)
-                print(f"✅ {binary} found in PATH: {result.stdout.strip()}")
-            else:
-                print(f"❌ {binary} NOT found in PATH")
-        except subprocess.TimeoutExpired:
-            print(f"⏰ {binary} command timed out")
-        except Exception as e:
-            print(f"❌ Error checking {binary}: {e}")
+        binary_path = shutil.which(binary)
+        if binary_path:
+            poppler_found.append(binary)
+            print(f"✅ {binary} found in PATH: {binary_path}")
+        else:
+            print(f"❌ {binary} NOT found in PATH")
     
     if poppler_found:
         print(f"✅ Poppler binaries found: {', '.join(poppler_found)}")
@@ -106,6 +102,11 @@ startxref
 0
 %%EOF"""
         
+        # Hand the PDF to the child via a temp file rather than a bytes repr in the source
+        with tempfile.NamedTemporaryFile('wb', suffix='.pdf', delete=False) as tmp:
+            tmp.write(minimal_pdf)
+            pdf_path = tmp.name
+        
         print("  - Attempting conversion with 10-second timeout...")
         start_time = time.time()
         
@@ -114,11 +115,9 @@ startxref
             result = subprocess.run([
                 sys.executable, '-c', 
                 f"""
-import sys
-sys.path.insert(0, '{os.getcwd()}')
 from pdf2image import convert_from_bytes
-minimal_pdf = {minimal_pdf}
-images = convert_from_bytes(minimal_pdf, dpi=72)
+with open({pdf_path!r}, 'rb') as f:
+    images = convert_from_bytes(f.read(), dpi=72)
 print(f'SUCCESS: Converted {{len(images)}} images')
 """
             ], capture_output=True, text=True, timeout=10)
@@ -138,6 +137,8 @@ print(f'SUCCESS: Converted {{len(images)}} images')
             print(f"⏰ pdf2image conversion TIMED OUT after {elapsed:.2f}s")
             print("   This is likely the cause of the API hanging!")
             return False
+        finally:
+            os.unlink(pdf_path)
             
     except Exception as e:
         print(f"❌ Error testing pdf2image conversion: {e}")
@@ -212,7 +213,6 @@ def test_antivirus_interference():
     
     # Check if we can create temporary files
     try:
-        import tempfile
         with tempfile.NamedTemporaryFile(delete=True) as tmp:
             tmp.write(b"test")
             print("✅ Can create temporary files")
@@ -286,4 +286,17 @@ def main():
         print("\n✅ All tests passed - the issue might be elsewhere")
 
 if __name__ == "__main__":
-    main()
+    # Set DIAG_PROFILE=1 to see where in-process time goes (e.g. pdf2image/fitz imports)
+    if os.environ.get('DIAG_PROFILE'):
+        import cProfile
+        import pstats
+        
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            main()
+        finally:
+            profiler.disable()
+            pstats.Stats(profiler).sort_stats('cumulative').print_stats(40)
+    else:
+        main()
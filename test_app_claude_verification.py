@@ -10,6 +10,7 @@ This script:
 
 import sys
 import os
+import traceback
 from pathlib import Path
 
 # Add parent directory to path
@@ -67,19 +68,23 @@ def verify_claude_usage(extractor: FinancialDataExtractor):
 def test_live_file():
     """Test processing a live file to verify Claude usage"""
     
-    # Live files available
+    # Live files available, in order of preference
+    live_dir = "tests/live"
     live_files = [
-        "tests/live/1_FS_Raw.pdf",
-        "tests/live/Y2024 Balance Sheet,Income Stateement & Cash Flow.pdf",
-        "tests/live/2024 ASSAI Audited Financial Statements (2).pdf",
+        "1_FS_Raw.pdf",
+        "Y2024 Balance Sheet,Income Stateement & Cash Flow.pdf",
+        "2024 ASSAI Audited Financial Statements (2).pdf",
     ]
     
+    # List the directory once instead of probing each candidate path
+    try:
+        with os.scandir(live_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        present = set()
+    
     # Find first available file
-    test_file = None
-    for file_path in live_files:
-        if os.path.exists(file_path):
-            test_file = file_path
-            break
+    test_file = next((f"{live_dir}/{name}" for name in live_files if name in present), None)
     
     if not test_file:
         print("❌ No live test files found!")
@@ -108,8 +113,8 @@ def test_live_file():
     # Process a small portion of the file (first few pages) to verify API calls
     print("\n[PROCESS] Processing file (first 2 pages only for quick test)...")
     try:
-        # Convert PDF to images
-        images, page_info = pdf_processor.convert_pdf_to_images(test_file, enable_parallel=False)
+        # Convert PDF to images (parallel per-page text extraction, same as app.py)
+        images, page_info = pdf_processor.convert_pdf_to_images(test_file, enable_parallel=True)
         
         if not images:
             print("❌ No images extracted from PDF")
@@ -144,7 +149,6 @@ def test_live_file():
             
     except Exception as e:
         print(f"\n❌ Error during processing: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
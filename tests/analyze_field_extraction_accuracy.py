@@ -4,34 +4,66 @@ Analyze field extraction accuracy using the better metric: Fields Extracted / Fi
 
 import os
 import sys
-import csv
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Any, Dict, Set
+
+import pandas as pd
 
 # Add the project root to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
-def load_csv_data(file_path: str) -> List[Dict[str, str]]:
-    """Load CSV data into a list of dictionaries"""
-    data = []
-    with open(file_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            data.append(row)
-    return data
+VALUE_COLUMNS = ('Value_Year_1', 'Value_Year_2')
+
 
+def count_fields_with_data(file_path: str) -> int:
+    """Count fields that have actual data (non-empty values) in a template CSV"""
+    df = pd.read_csv(file_path, usecols=lambda column: column in VALUE_COLUMNS,
+                     dtype=str, keep_default_na=False, encoding='utf-8')
+    has_data = df.fillna('').apply(lambda values: values.str.strip().ne('')).any(axis=1)
+    return int(has_data.sum())
 
-def count_fields_with_data(data: List[Dict[str, str]]) -> int:
-    """Count fields that have actual data (non-empty values)"""
-    count = 0
-    for row in data:
-        year1 = row.get('Value_Year_1', '').strip()
-        year2 = row.get('Value_Year_2', '').strip()
-        if year1 or year2:  # Has data in either year
-            count += 1
-    return count
+
+def _list_file_names(directory: str) -> Set[str]:
+    """List the file names in a directory (empty if the directory is missing)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def _compare_fields(comp: Dict[str, str]) -> Dict[str, Any]:
+    """Count populated fields for one actual/expected pair"""
+    # Count fields with data
+    actual_fields_with_data = count_fields_with_data(comp['actual'])
+    expected_fields_with_data = count_fields_with_data(comp['expected'])
+    
+    # Calculate extraction rate
+    if expected_fields_with_data > 0:
+        extraction_rate = (actual_fields_with_data / expected_fields_with_data) * 100
+    else:
+        extraction_rate = 0
+    
+    # Determine status
+    if extraction_rate >= 80:
+        status = "✅ EXCELLENT"
+    elif extraction_rate >= 60:
+        status = "⚠️ GOOD"
+    elif extraction_rate >= 40:
+        status = "⚠️ ACCEPTABLE"
+    else:
+        status = "❌ NEEDS IMPROVEMENT"
+    
+    return {
+        'name': comp['name'],
+        'fields_extracted': actual_fields_with_data,
+        'fields_expected': expected_fields_with_data,
+        'extraction_rate': extraction_rate,
+        'status': status
+    }
 
 
 def analyze_field_extraction_accuracy():
@@ -70,53 +102,35 @@ def analyze_field_extraction_accuracy():
     total_extracted = 0
     total_expected = 0
     
+    # List each directory once instead of checking every file separately
+    directories = {os.path.dirname(comp[key]) for comp in comparisons for key in ('actual', 'expected')}
+    listings = {directory: _list_file_names(directory) for directory in directories}
+    found = [
+        comp for comp in comparisons
+        if all(os.path.basename(comp[key]) in listings[os.path.dirname(comp[key])] for key in ('actual', 'expected'))
+    ]
+    
+    # Each comparison only reads its own pair of files, so count them concurrently
+    with ThreadPoolExecutor(max_workers=max(1, len(found))) as executor:
+        compared = dict(zip((comp['name'] for comp in found), executor.map(_compare_fields, found)))
+    
     for comp in comparisons:
-        if Path(comp['actual']).exists() and Path(comp['expected']).exists():
-            print(f"📄 {comp['name']}")
-            print("-" * 40)
-            
-            # Load data
-            actual_data = load_csv_data(comp['actual'])
-            expected_data = load_csv_data(comp['expected'])
-            
-            # Count fields with data
-            actual_fields_with_data = count_fields_with_data(actual_data)
-            expected_fields_with_data = count_fields_with_data(expected_data)
-            
-            # Calculate extraction rate
-            if expected_fields_with_data > 0:
-                extraction_rate = (actual_fields_with_data / expected_fields_with_data) * 100
-            else:
-                extraction_rate = 0
-            
-            # Determine status
-            if extraction_rate >= 80:
-                status = "✅ EXCELLENT"
-            elif extraction_rate >= 60:
-                status = "⚠️ GOOD"
-            elif extraction_rate >= 40:
-                status = "⚠️ ACCEPTABLE"
-            else:
-                status = "❌ NEEDS IMPROVEMENT"
-            
-            print(f"   Fields Extracted: {actual_fields_with_data}")
-            print(f"   Fields Expected:  {expected_fields_with_data}")
-            print(f"   Extraction Rate:  {extraction_rate:.1f}%")
-            print(f"   Status:           {status}")
-            print()
-            
-            results.append({
-                'name': comp['name'],
-                'fields_extracted': actual_fields_with_data,
-                'fields_expected': expected_fields_with_data,
-                'extraction_rate': extraction_rate,
-                'status': status
-            })
-            
-            total_extracted += actual_fields_with_data
-            total_expected += expected_fields_with_data
-        else:
+        result = compared.get(comp['name'])
+        if result is None:
             print(f"⚠️ Skipping {comp['name']} - files not found")
+            continue
+        
+        print(f"📄 {comp['name']}")
+        print("-" * 40)
+        print(f"   Fields Extracted: {result['fields_extracted']}")
+        print(f"   Fields Expected:  {result['fields_expected']}")
+        print(f"   Extraction Rate:  {result['extraction_rate']:.1f}%")
+        print(f"   Status:           {result['status']}")
+        print()
+        
+        results.append(result)
+        total_extracted += result['fields_extracted']
+        total_expected += result['fields_expected']
     
     # Overall summary
     if total_expected > 0:
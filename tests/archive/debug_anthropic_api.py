@@ -4,20 +4,29 @@ Debug test for Anthropic API to identify the exact issue
 
 import anthropic
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict
 
-def load_env_file():
-    """Load environment variables from .env file"""
+@lru_cache(maxsize=1)
+def _read_env_file() -> Dict[str, str]:
+    """Parse the .env file once per process"""
     env_path = Path(".env")
-    if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    # Remove quotes if present
-                    value = value.strip('"').strip("'")
-                    os.environ[key] = value
+    if not env_path.exists():
+        return {}
+    values = {}
+    for line in env_path.read_text().splitlines():
+        line = line.strip()
+        if line and not line.startswith('#') and '=' in line:
+            key, _, value = line.partition('=')
+            # Remove quotes if present
+            values[key] = value.strip('"').strip("'")
+    return values
+
+def load_env_file():
+    """Load environment variables from .env file (existing variables win, as with load_dotenv)"""
+    for key, value in _read_env_file().items():
+        os.environ.setdefault(key, value)
 
 def test_anthropic_api():
     """Test minimal Anthropic API call to debug HTTP 400 errors"""
@@ -6,23 +6,61 @@ Simplified Unified Test Runner - Robust version without timeout issues
 import os
 import sys
 import time
-import signal
+import threading
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Config reads AI_PROVIDER from the environment, so setting it and building the
+# extractor must not interleave between providers running side by side
+_PROVIDER_LOCK = threading.Lock()
 
-class TimeoutError(Exception):
-    """Timeout exception"""
-    pass
+# Config attributes holding the API key and model for each supported provider
+PROVIDER_PROFILES = {
+    "openai": {"api_key": "OPENAI_API_KEY", "model": "OPENAI_MODEL"},
+    "anthropic": {"api_key": "ANTHROPIC_API_KEY", "model": "ANTHROPIC_MODEL"},
+}
 
 
-def timeout_handler(signum, frame):
-    """Handle timeout signal"""
-    raise TimeoutError("Operation timed out")
+def run_with_timeout(func, timeout: int, *args):
+    """Run func in a daemon thread, raising TimeoutError if it does not finish in time.
+
+    Unlike SIGALRM this works from any thread. A timed-out call cannot be
+    interrupted, but its daemon thread does not keep the process alive at exit.
+    """
+    outcome = {}
+    
+    def target():
+        try:
+            outcome['result'] = func(*args)
+        except BaseException as e:
+            outcome['error'] = e
+    
+    worker = threading.Thread(target=target, daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        raise TimeoutError(f"Operation timed out after {timeout} seconds")
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['result']
+
+
+@lru_cache(maxsize=4)
+def get_processing_stack(provider: str):
+    """Create the extractor and PDF processor for a provider once and reuse them"""
+    from core.extractor import FinancialDataExtractor
+    from core.pdf_processor import PDFProcessor
+    
+    with _PROVIDER_LOCK:
+        os.environ['AI_PROVIDER'] = provider
+        extractor = FinancialDataExtractor()
+        return extractor, PDFProcessor(extractor)
 
 
 class SimpleUnifiedRunner:
@@ -36,27 +74,19 @@ class SimpleUnifiedRunner:
         """Validate a single provider with timeout protection"""
         print(f"🔍 Validating {provider} provider...")
         
+        profile = PROVIDER_PROFILES.get(provider)
+        if profile is None:
+            print(f"   ❌ Unsupported provider: {provider} (expected one of: {', '.join(PROVIDER_PROFILES)})")
+            return False
+        
         try:
-            # Set timeout
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(30)  # 30 second timeout for validation
-            
-            # Set environment variable
-            os.environ['AI_PROVIDER'] = provider
-            
-            # Import and initialize
-            from core.config import Config
-            from core.extractor import FinancialDataExtractor
-            
-            config = Config()
-            extractor = FinancialDataExtractor()
+            # Initialize with a 30 second timeout for validation
+            extractor, _ = run_with_timeout(get_processing_stack, 30, provider)
+            config = extractor.config
             
             # Check configuration
-            if provider == "openai" and not config.OPENAI_API_KEY:
-                print(f"   ❌ OPENAI_API_KEY not found")
-                return False
-            elif provider == "anthropic" and not config.ANTHROPIC_API_KEY:
-                print(f"   ❌ ANTHROPIC_API_KEY not found")
+            if not getattr(config, profile['api_key']):
+                print(f"   ❌ {profile['api_key']} not found")
                 return False
             
             # Check provider is set correctly
@@ -64,7 +94,7 @@ class SimpleUnifiedRunner:
                 print(f"   ❌ Provider not set correctly: {extractor.provider}")
                 return False
             
-            print(f"   ✅ {provider} provider validated: {getattr(config, f'{provider.upper()}_MODEL', 'N/A')}")
+            print(f"   ✅ {provider} provider validated: {getattr(config, profile['model'], 'N/A')}")
             return True
             
         except TimeoutError:
@@ -73,11 +103,10 @@ class SimpleUnifiedRunner:
         except Exception as e:
             print(f"   ❌ {provider} validation failed: {e}")
             return False
-        finally:
-            signal.alarm(0)  # Disable alarm
     
-    def test_single_document(self, provider: str, document_path: str, timeout: int = 180) -> Dict:
-        """Test a single document with robust timeout handling"""
+    def test_single_document(self, provider: str, document_path: str, timeout: int = 180,
+                             pdf_data: Optional[bytes] = None) -> Dict:
+        """Test a single document with robust timeout handling (pdf_data skips re-reading the file)"""
         print(f"🧪 Testing {provider} with {Path(document_path).name}")
         
         start_time = time.time()
@@ -91,30 +120,12 @@ class SimpleUnifiedRunner:
         }
         
         try:
-            # Set timeout
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(timeout)
-            
-            # Set environment variable
-            os.environ['AI_PROVIDER'] = provider
-            
-            # Import and initialize
-            from core.extractor import FinancialDataExtractor
-            from core.pdf_processor import PDFProcessor
-            
-            extractor = FinancialDataExtractor()
-            pdf_processor = PDFProcessor(extractor)
-            
             # Check if document exists
             if not Path(document_path).exists():
                 result['error'] = f"Document not found: {document_path}"
                 return result
             
-            # Process document
-            with open(document_path, 'rb') as f:
-                pdf_data = f.read()
-            
-            extracted_data = pdf_processor.process_pdf_with_vector_db(pdf_data)
+            extracted_data = run_with_timeout(self._process_document, timeout, provider, document_path, pdf_data)
             
             processing_time = time.time() - start_time
             
@@ -140,21 +151,43 @@ class SimpleUnifiedRunner:
             result['processing_time'] = time.time() - start_time
             print(f"   ❌ Error: {str(e)}")
             return result
-        finally:
-            signal.alarm(0)  # Disable alarm
     
-    def compare_providers(self, providers: List[str], document_path: str, timeout: int = 180) -> Dict:
-        """Compare multiple providers on same document"""
+    def _process_document(self, provider: str, document_path: str, pdf_data: Optional[bytes] = None) -> Optional[Dict]:
+        """Extract a document with the cached processor for the given provider"""
+        _, pdf_processor = get_processing_stack(provider)
+        
+        if pdf_data is None:
+            with open(document_path, 'rb') as f:
+                pdf_data = f.read()
+        
+        return pdf_processor.process_pdf_with_vector_db(pdf_data)
+    
+    def compare_providers(self, providers: List[str], document_path: str, timeout: int = 180,
+                          sequential: bool = False) -> Dict:
+        """Compare multiple providers on same document (sequential=True gives benchmark timings)"""
         print(f"🔄 Comparing providers: {', '.join(providers)}")
         print(f"📄 Document: {Path(document_path).name}")
         print("=" * 60)
         
-        results = {}
+        # Read the document once and hand the same bytes to every provider
+        pdf_data = Path(document_path).read_bytes() if Path(document_path).exists() else None
         
-        for provider in providers:
-            print(f"\n📊 Testing {provider}...")
-            result = self.test_single_document(provider, document_path, timeout)
-            results[provider] = result
+        if sequential:
+            # One provider at a time, so each timing has the process to itself
+            results = {
+                provider: self.test_single_document(provider, document_path, timeout, pdf_data)
+                for provider in providers
+            }
+        else:
+            # Providers are independent API-bound jobs, so run them side by side;
+            # each one still enforces its own timeout
+            with ThreadPoolExecutor(max_workers=len(providers)) as executor:
+                futures = [
+                    (provider, executor.submit(self.test_single_document, provider, document_path, timeout, pdf_data))
+                    for provider in providers
+                ]
+                results = {provider: future.result() for provider, future in futures}
+        timing_note = "sequential run" if sequential else "concurrent run - shared CPU/GIL, not a benchmark"
         
         # Print comparison
         print(f"\n📊 PROVIDER COMPARISON RESULTS")
@@ -167,8 +200,10 @@ class SimpleUnifiedRunner:
             winner = min(successful_results.keys(), 
                         key=lambda k: successful_results[k]['processing_time'])
             
-            print(f"🏆 Winner: {winner}")
+            print(f"🏆 Fastest: {winner} ({timing_note})")
             print(f"⏱️  Processing Time: {successful_results[winner]['processing_time']:.1f}s")
+            if not sequential:
+                print("   Use --sequential for timings comparable as a benchmark")
             
             # Show all results
             for provider, result in results.items():
@@ -245,6 +280,8 @@ def main():
                        help="Compare multiple providers")
     parser.add_argument("--providers", default="openai,anthropic",
                        help="Providers to compare (comma-separated)")
+    parser.add_argument("--sequential", action="store_true",
+                       help="Run compared providers one at a time for benchmark timings")
     parser.add_argument("--timeout", type=int, default=180,
                        help="Timeout in seconds")
     
@@ -257,7 +294,7 @@ def main():
         if not args.file:
             print("❌ --file required for provider comparison")
             sys.exit(1)
-        runner.compare_providers(providers, args.file, args.timeout)
+        runner.compare_providers(providers, args.file, args.timeout, args.sequential)
     else:
         runner.run_quick_test(args.provider, args.file)
 
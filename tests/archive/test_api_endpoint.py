@@ -7,6 +7,18 @@ import requests
 import time
 import os
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Shared keep-alive session. Connection failures are retried with backoff; status
+# retries only apply to GET, so a slow /extract POST is never silently re-run.
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(max_retries=Retry(
+    total=3, backoff_factor=0.5, status_forcelist=(429, 502, 503, 504)
+)))
+
+
 def test_api_endpoint():
     """Test the API extract endpoint"""
     print("🔍 Testing API extract endpoint...")
@@ -30,7 +42,7 @@ def test_api_endpoint():
             start_time = time.time()
             
             # Send request with timeout
-            response = requests.post(
+            response = _SESSION.post(
                 'http://localhost:8000/extract',
                 files=files,
                 data=data,
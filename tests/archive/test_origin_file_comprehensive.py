@@ -8,12 +8,26 @@ import sys
 import os
 import json
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from core.pdf_processor import PDFProcessor
 from core.extractor import FinancialDataExtractor
 
+def _timed(fn, *args):
+    """Run fn(*args) and return (result, elapsed_seconds)"""
+    start_time = time.time()
+    result = fn(*args)
+    return result, time.time() - start_time
+
+def _min_max_avg(values):
+    """Min/max/average of a sequence of numbers (all 0 when empty)"""
+    if not values:
+        return {"min": 0, "max": 0, "avg": 0}
+    return {"min": min(values), "max": max(values), "avg": sum(values) / len(values)}
+
 def test_origin_file_comprehensive():
     """Test the three-score classification on ORIGIN files with detailed logging"""
     
@@ -21,6 +35,9 @@ def test_origin_file_comprehensive():
     print("COMPREHENSIVE ORIGIN FILE TEST - THREE-SCORE CLASSIFICATION")
     print("=" * 80)
     
+    # One timestamp for the run: reported test time, log contents and log filename all agree
+    test_time = datetime.now()
+    
     # Initialize components
     extractor = FinancialDataExtractor()
     processor = PDFProcessor(extractor)
@@ -34,13 +51,13 @@ def test_origin_file_comprehensive():
         
     print(f"TESTING: {os.path.basename(test_file)}")
     print(f"FILE PATH: {test_file}")
-    print(f"TEST TIME: {datetime.now().isoformat()}")
+    print(f"TEST TIME: {test_time.isoformat()}")
     print("=" * 60)
     
     # Create detailed log structure
     test_log = {
         "test_file": test_file,
-        "test_time": datetime.now().isoformat(),
+        "test_time": test_time.isoformat(),
         "test_type": "three_score_classification_origin",
         "results": {}
     }
@@ -48,16 +65,27 @@ def test_origin_file_comprehensive():
     try:
         # Step 1: PDF Conversion
         print(f"[STEP 1] Converting PDF to images...")
-        start_time = time.time()
-        
-        images, page_info = processor.convert_pdf_to_images(test_file, enable_parallel=True)
-        conversion_time = time.time() - start_time
+        images, raster_time = _timed(processor._rasterize_pdf, test_file)
         
         if not images:
             print(f"[ERROR] No images extracted")
             test_log["results"]["error"] = "No images extracted from PDF"
             return
+        
+        # Step 2: Three-Score Classification
+        # Text extraction and classification both only need the page images and are both
+        # API-bound, so run them side by side instead of classifying after conversion finishes
+        print(f"[STEP 2] Running three-score classification alongside text extraction...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            text_future = executor.submit(_timed, processor._extract_text_from_images, images, True)
+            # Batched classification: several pages per API call, falling back to single pages on error
+            classification_future = executor.submit(_timed, processor.classify_pages_with_vision_batch, images)
             
+            page_info, text_time = text_future.result()
+            financial_pages, classification_time = classification_future.result()
+        
+        # Same scope as the old convert_pdf_to_images timing: rasterization plus text extraction
+        conversion_time = raster_time + text_time
         print(f"[SUCCESS] PDF converted to {len(images)} pages in {conversion_time:.2f}s")
         
         test_log["results"]["pdf_conversion"] = {
@@ -66,41 +94,34 @@ def test_origin_file_comprehensive():
             "page_info": page_info
         }
         
-        # Step 2: Three-Score Classification
-        print(f"[STEP 2] Running three-score classification...")
-        start_time = time.time()
-        
-        financial_pages = processor.classify_pages_with_vision(images)
-        classification_time = time.time() - start_time
-        
         print(f"[SUCCESS] Classification completed in {classification_time:.2f}s")
         
         # Step 3: Detailed Analysis
         print(f"[STEP 3] Analyzing results...")
         
         # Count by statement type
-        bs_pages = [p for p in financial_pages if p['statement_type'] == 'balance_sheet']
-        is_pages = [p for p in financial_pages if p['statement_type'] == 'income_statement']
-        cf_pages = [p for p in financial_pages if p['statement_type'] == 'cash_flow']
+        type_counts = Counter(p['statement_type'] for p in financial_pages)
         
-        # Calculate confidence statistics
-        all_confidences = [p['confidence'] for p in financial_pages]
-        avg_confidence = sum(all_confidences) / len(all_confidences) if all_confidences else 0
-        min_confidence = min(all_confidences) if all_confidences else 0
-        max_confidence = max(all_confidences) if all_confidences else 0
+        # Gather confidence and score columns in one pass over the pages
+        rows = [
+            (p['confidence'], p['scores']['balance_sheet'], p['scores']['income_statement'], p['scores']['cash_flow'])
+            for p in financial_pages
+        ]
+        all_confidences, bs_scores, is_scores, cf_scores = zip(*rows) if rows else ((), (), (), ())
         
-        # Score analysis
-        bs_scores = [p['scores']['balance_sheet'] for p in financial_pages]
-        is_scores = [p['scores']['income_statement'] for p in financial_pages]
-        cf_scores = [p['scores']['cash_flow'] for p in financial_pages]
+        # Calculate confidence statistics
+        confidence_stats = _min_max_avg(all_confidences)
+        avg_confidence = confidence_stats["avg"]
+        min_confidence = confidence_stats["min"]
+        max_confidence = confidence_stats["max"]
         
         test_log["results"]["classification"] = {
             "total_financial_pages": len(financial_pages),
             "classification_time_seconds": classification_time,
             "statement_type_breakdown": {
-                "balance_sheet_pages": len(bs_pages),
-                "income_statement_pages": len(is_pages),
-                "cash_flow_pages": len(cf_pages)
+                "balance_sheet_pages": type_counts['balance_sheet'],
+                "income_statement_pages": type_counts['income_statement'],
+                "cash_flow_pages": type_counts['cash_flow']
             },
             "confidence_statistics": {
                 "average_confidence": avg_confidence,
@@ -108,21 +129,9 @@ def test_origin_file_comprehensive():
                 "max_confidence": max_confidence
             },
             "score_statistics": {
-                "balance_sheet_scores": {
-                    "min": min(bs_scores) if bs_scores else 0,
-                    "max": max(bs_scores) if bs_scores else 0,
-                    "avg": sum(bs_scores) / len(bs_scores) if bs_scores else 0
-                },
-                "income_statement_scores": {
-                    "min": min(is_scores) if is_scores else 0,
-                    "max": max(is_scores) if is_scores else 0,
-                    "avg": sum(is_scores) / len(is_scores) if is_scores else 0
-                },
-                "cash_flow_scores": {
-                    "min": min(cf_scores) if cf_scores else 0,
-                    "max": max(cf_scores) if cf_scores else 0,
-                    "avg": sum(cf_scores) / len(cf_scores) if cf_scores else 0
-                }
+                "balance_sheet_scores": _min_max_avg(bs_scores),
+                "income_statement_scores": _min_max_avg(is_scores),
+                "cash_flow_scores": _min_max_avg(cf_scores)
             },
             "detailed_pages": []
         }
@@ -138,36 +147,41 @@ def test_origin_file_comprehensive():
             }
             test_log["results"]["classification"]["detailed_pages"].append(page_detail)
         
-        # Step 4: Display Results
-        print(f"\n[RESULTS] Classification Results:")
-        print(f"  Total pages: {len(images)}")
-        print(f"  Financial pages identified: {len(financial_pages)}")
-        print(f"  Classification time: {classification_time:.2f}s")
+        # Step 4: Display Results (collected and written as one block)
+        result_lines = [
+            f"\n[RESULTS] Classification Results:",
+            f"  Total pages: {len(images)}",
+            f"  Financial pages identified: {len(financial_pages)}",
+            f"  Classification time: {classification_time:.2f}s",
+        ]
         
         if financial_pages:
-            print(f"\n  Statement type breakdown:")
-            print(f"    Balance Sheet pages: {len(bs_pages)}")
-            print(f"    Income Statement pages: {len(is_pages)}")
-            print(f"    Cash Flow pages: {len(cf_pages)}")
-            
-            print(f"\n  Confidence statistics:")
-            print(f"    Average confidence: {avg_confidence:.2f}")
-            print(f"    Min confidence: {min_confidence:.2f}")
-            print(f"    Max confidence: {max_confidence:.2f}")
-            
-            print(f"\n  Page details (first 10 pages):")
-            for i, page in enumerate(financial_pages[:10]):
-                scores = page['scores']
-                print(f"    Page {page['page_num'] + 1}: {page['statement_type']} "
-                      f"(BS:{scores['balance_sheet']}, IS:{scores['income_statement']}, CF:{scores['cash_flow']}) "
-                      f"Confidence: {page['confidence']:.2f}")
+            result_lines += [
+                f"\n  Statement type breakdown:",
+                f"    Balance Sheet pages: {type_counts['balance_sheet']}",
+                f"    Income Statement pages: {type_counts['income_statement']}",
+                f"    Cash Flow pages: {type_counts['cash_flow']}",
+                f"\n  Confidence statistics:",
+                f"    Average confidence: {avg_confidence:.2f}",
+                f"    Min confidence: {min_confidence:.2f}",
+                f"    Max confidence: {max_confidence:.2f}",
+                f"\n  Page details (first 10 pages):",
+            ]
+            result_lines += [
+                f"    Page {page['page_num'] + 1}: {page['statement_type']} "
+                f"(BS:{page['scores']['balance_sheet']}, IS:{page['scores']['income_statement']}, CF:{page['scores']['cash_flow']}) "
+                f"Confidence: {page['confidence']:.2f}"
+                for page in financial_pages[:10]
+            ]
             
             if len(financial_pages) > 10:
-                print(f"    ... and {len(financial_pages) - 10} more pages")
+                result_lines.append(f"    ... and {len(financial_pages) - 10} more pages")
         else:
-            print(f"  [WARNING] No financial pages identified!")
+            result_lines.append(f"  [WARNING] No financial pages identified!")
             test_log["results"]["classification"]["warning"] = "No financial pages identified"
         
+        print("\n".join(result_lines))
+        
         # Step 5: Year Extraction Test
         print(f"\n[STEP 4] Testing year extraction from financial pages...")
         start_time = time.time()
@@ -187,24 +201,17 @@ def test_origin_file_comprehensive():
         print(f"  Source: {year_data.get('source', 'unknown')}")
         print(f"  Extraction time: {year_extraction_time:.2f}s")
         
-        # Step 6: Save detailed log
-        log_filename = f"test_log_origin_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(log_filename, 'w') as f:
-            json.dump(test_log, f, indent=2)
-        
-        print(f"\n[SUCCESS] Detailed test log saved to: {log_filename}")
-        
-        # Step 7: Summary for ACE Analysis
+        # Step 6: Summary for ACE Analysis (the detailed log is saved once, in the finally block)
         print(f"\n[ACE ANALYSIS SUMMARY]")
         print(f"  Classification Success: {'✅ YES' if financial_pages else '❌ NO'}")
-        print(f"  Statement Types Identified: {len(set(p['statement_type'] for p in financial_pages))}")
+        print(f"  Statement Types Identified: {len(type_counts)}")
         print(f"  Average Confidence: {avg_confidence:.2f}")
         print(f"  Years Extracted: {len(year_data.get('years', []))}")
         print(f"  Ready for Phase 1.2 (Reflector): {'✅ YES' if financial_pages else '❌ NO'}")
         
         test_log["results"]["ace_analysis"] = {
             "classification_success": bool(financial_pages),
-            "statement_types_identified": len(set(p['statement_type'] for p in financial_pages)),
+            "statement_types_identified": len(type_counts),
             "average_confidence": avg_confidence,
             "years_extracted": len(year_data.get('years', [])),
             "ready_for_phase_1_2": bool(financial_pages)
@@ -221,8 +228,8 @@ def test_origin_file_comprehensive():
         }
     
     finally:
-        # Save final log even if there was an error
-        log_filename = f"test_log_origin_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        # Save the log exactly once - after the ACE summary on success, or with the error details
+        log_filename = f"test_log_origin_{test_time.strftime('%Y%m%d_%H%M%S')}.json"
         with open(log_filename, 'w') as f:
             json.dump(test_log, f, indent=2)
         
@@ -4,24 +4,15 @@ Poppler Installation Test Script
 Tests if Poppler is properly installed and functioning with pdf2image
 """
 
+import os
 import sys
+import tempfile
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, version
 
-def test_poppler_installation():
-    """Test that Poppler is properly installed and functioning"""
-    print("🔍 Testing Poppler Installation...")
-    print("=" * 50)
-    
-    # Test 1: Import pdf2image
-    try:
-        from pdf2image import convert_from_bytes
-        print("✅ pdf2image import: SUCCESS")
-    except ImportError as e:
-        print(f"❌ pdf2image import: FAILED - {e}")
-        return False
-    
-    # Test 2: Create minimal PDF
-    minimal_pdf = b"""%PDF-1.4
+# Single blank US Letter page used by the conversion checks
+MINIMAL_PDF = b"""%PDF-1.4
 1 0 obj
 <<
 /Type /Catalog
@@ -56,13 +47,42 @@ trailer
 startxref
 0
 %%EOF"""
+
+
+def test_poppler_installation():
+    """Test that Poppler is properly installed and functioning"""
+    print("🔍 Testing Poppler Installation...")
+    print("=" * 50)
+    
+    # Test 1: Import pdf2image
+    try:
+        from pdf2image import convert_from_path
+        print("✅ pdf2image import: SUCCESS")
+    except ImportError as e:
+        print(f"❌ pdf2image import: FAILED - {e}")
+        return False
+    
+    # Test 2: Write the minimal PDF once; both conversions read the same file
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as pdf_file:
+        pdf_file.write(MINIMAL_PDF)
+    pdf_path = pdf_file.name
     
     print("✅ Minimal PDF created: SUCCESS")
     
+    # Tests 3 and 4 are independent, so start both conversions together and check them in order.
+    # thread_count lets pdf2image spread multi-page documents across the remaining cores.
+    thread_count = max(1, (os.cpu_count() or 2) - 1)
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            standard_future = executor.submit(convert_from_path, pdf_path, dpi=72, thread_count=thread_count)
+            high_dpi_future = executor.submit(convert_from_path, pdf_path, dpi=200, thread_count=thread_count)
+    finally:
+        os.unlink(pdf_path)
+    
     # Test 3: Convert PDF to images using pdf2image
     try:
         print("🔄 Testing PDF to image conversion...")
-        images = convert_from_bytes(minimal_pdf, dpi=72)
+        images = standard_future.result()
         
         if images and len(images) == 1:
             print(f"✅ PDF conversion: SUCCESS - {len(images)} image(s) created")
@@ -82,7 +102,7 @@ startxref
     # Test 4: Test with higher DPI
     try:
         print("🔄 Testing high DPI conversion...")
-        images_hd = convert_from_bytes(minimal_pdf, dpi=200)
+        images_hd = high_dpi_future.result()
         
         if images_hd and len(images_hd) == 1:
             print(f"✅ High DPI conversion: SUCCESS - {len(images_hd)} image(s) created")
@@ -107,19 +127,12 @@ def test_system_info():
     print(f"Python version: {sys.version}")
     print(f"Platform: {sys.platform}")
     
-    # Try to get pdf2image version
-    try:
-        import pdf2image
-        print(f"pdf2image version: {pdf2image.__version__}")
-    except:
-        print("pdf2image version: Unknown")
-    
-    # Try to get PIL version
-    try:
-        from PIL import Image
-        print(f"Pillow version: {Image.__version__}")
-    except:
-        print("Pillow version: Unknown")
+    # Read versions from package metadata so neither package has to be imported
+    for package in ("pdf2image", "Pillow"):
+        try:
+            print(f"{package} version: {version(package)}")
+        except PackageNotFoundError:
+            print(f"{package} version: Unknown")
 
 if __name__ == "__main__":
     print("🧪 Poppler Installation Test")
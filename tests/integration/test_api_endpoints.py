@@ -112,6 +112,14 @@ class TestAPIEndpoints:
         assert "access-control-allow-methods" in response.headers
         assert "access-control-allow-headers" in response.headers
     
+    def test_gzip_compression(self):
+        """Test large responses are gzip-compressed when the client accepts it"""
+        response = self.client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+        
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "paths" in response.json()
+    
     def test_error_handling_404(self):
         """Test 404 error handling"""
         response = self.client.get("/nonexistent")
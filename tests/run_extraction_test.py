@@ -204,13 +204,7 @@ def run_extraction_test(pdf_path: str, output_dir: str = None):
         if not use_batch_extraction:
             # Extract years from financial pages before processing
             print("[INFO] Extracting years from financial pages...")
-            page_images = []
-            max_page_num = max((page.get('page_num', 0) for page in financial_pages), default=0)
-            page_images = [None] * (max_page_num + 1)
-            for page in financial_pages:
-                page_num = page.get('page_num', 0)
-                if 'image' in page:
-                    page_images[page_num] = page['image']
+            page_images = {page.get('page_num', 0): page['image'] for page in financial_pages if 'image' in page}
             
             year_data = processor._extract_years_from_financial_pages(page_images, financial_pages)
             
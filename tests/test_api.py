@@ -7,7 +7,9 @@ This script tests the API with the test fixtures and validates the results.
 import os
 import json
 import time
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, Any, List
 
@@ -15,17 +17,40 @@ from typing import Dict, Any, List
 class APITester:
     """API testing class for financial statement transcription"""
     
-    def __init__(self, base_url: str = "http://localhost:8000"):
+    def __init__(self, base_url: str = "http://localhost:8000", max_workers: int = 3):
         """Initialize API tester"""
         self.base_url = base_url
+        self.max_workers = max_workers
+        # requests.Session is not documented as thread-safe, so each worker thread gets its
+        # own session (reusing keep-alive connections across that thread's calls)
+        self._local = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._sessions_lock = threading.Lock()
         self.fixtures_dir = Path("tests/fixtures")
         self.results_dir = Path("tests/results")
         self.results_dir.mkdir(exist_ok=True)
     
+    @property
+    def session(self) -> requests.Session:
+        """Session for the calling thread, created on first use"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+    
+    def close(self):
+        """Close the sessions opened by every thread"""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+    
     def test_health(self) -> bool:
         """Test API health endpoint"""
         try:
-            response = requests.get(f"{self.base_url}/health")
+            response = self.session.get(f"{self.base_url}/health", timeout=5)
             if response.status_code == 200:
                 print("✅ API health check passed")
                 return True
@@ -46,7 +71,7 @@ class APITester:
                 data = {'statement_type': statement_type}
                 
                 start_time = time.time()
-                response = requests.post(f"{self.base_url}/extract", files=files, data=data)
+                response = self.session.post(f"{self.base_url}/extract", files=files, data=data)
                 processing_time = time.time() - start_time
             
             if response.status_code == 200:
@@ -67,6 +92,20 @@ class APITester:
             print(f"❌ Error: {str(e)}")
             return {"error": str(e)}
     
+    def _test_documents(self, pdf_files: List[Path]) -> Dict[str, Any]:
+        """Submit documents concurrently - each upload is independent and waits on the API"""
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            future_to_file = {
+                executor.submit(self.test_single_document, pdf_file): pdf_file
+                for pdf_file in pdf_files
+            }
+            for future in as_completed(future_to_file):
+                results[future_to_file[future].name] = future.result()
+        
+        # Report in the original file order regardless of completion order
+        return {pdf_file.name: results[pdf_file.name] for pdf_file in pdf_files}
+    
     def test_light_files(self) -> Dict[str, Any]:
         """Test API with light files (extracted statement pages)"""
         light_dir = self.fixtures_dir / "light"
@@ -74,7 +113,6 @@ class APITester:
             print("❌ Light files directory not found")
             return {}
         
-        results = {}
         pdf_files = list(light_dir.glob("*.pdf"))
         
         if not pdf_files:
@@ -83,11 +121,7 @@ class APITester:
         
         print(f"🧪 Testing {len(pdf_files)} light files...")
         
-        for pdf_file in pdf_files:
-            result = self.test_single_document(pdf_file)
-            results[pdf_file.name] = result
-        
-        return results
+        return self._test_documents(pdf_files)
     
     def test_origin_files(self) -> Dict[str, Any]:
         """Test API with origin files (full documents)"""
@@ -96,7 +130,6 @@ class APITester:
             print("❌ Origin files directory not found")
             return {}
         
-        results = {}
         pdf_files = list(origin_dir.glob("*.pdf"))
         
         if not pdf_files:
@@ -105,11 +138,7 @@ class APITester:
         
         print(f"🧪 Testing {len(pdf_files)} origin files...")
         
-        for pdf_file in pdf_files:
-            result = self.test_single_document(pdf_file)
-            results[pdf_file.name] = result
-        
-        return results
+        return self._test_documents(pdf_files)
     
     def validate_results(self, results: Dict[str, Any]) -> Dict[str, Any]:
         """Validate API results against expected criteria"""
@@ -237,7 +266,10 @@ class APITester:
 def main():
     """Main function to run tests"""
     tester = APITester()
-    tester.run_full_test()
+    try:
+        tester.run_full_test()
+    finally:
+        tester.close()
 
 
 if __name__ == "__main__":
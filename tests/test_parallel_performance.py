@@ -108,18 +108,15 @@ def select_representative_pages(financial_pages, max_per_type=2):
 def validate_accuracy(csv_path, expected_csv_path, file_name):
     """Run accuracy validation using existing scoring scripts"""
     try:
-        from tests.analyze_field_extraction_accuracy import count_fields_with_data, load_csv_data
+        from tests.analyze_field_extraction_accuracy import count_fields_with_data
         from tests.compare_results_vs_expected import compare_csv_files
         
         if not os.path.exists(csv_path) or not os.path.exists(expected_csv_path):
             return None
         
         # Field Extraction Rate (Primary Metric)
-        actual_data = load_csv_data(csv_path)
-        expected_data = load_csv_data(expected_csv_path)
-        
-        actual_fields = count_fields_with_data(actual_data)
-        expected_fields = count_fields_with_data(expected_data)
+        actual_fields = count_fields_with_data(csv_path)
+        expected_fields = count_fields_with_data(expected_csv_path)
         
         extraction_rate = (actual_fields / expected_fields * 100) if expected_fields > 0 else 0
         
@@ -0,0 +1,359 @@
+"""
+Unit tests for the core PDF processor batch-extraction helpers.
+"""
+
+import sys
+import types
+import pytest
+from unittest.mock import Mock, patch
+from core.pdf_processor import PDFProcessor, _ASCII_TRANSLATE
+
+
+def _fake_batch_processor_module(extracted_items, total_cost=0.3):
+    """Build a stand-in for core.batch_processor returning canned batch results"""
+    module = types.ModuleType('core.batch_processor')
+
+    class DocumentStructureAnalyzer:
+        def analyze_document_structure(self, selected_pages):
+            return {'balance_sheet': selected_pages}
+
+        def create_processing_batches(self, statement_groups, template_fields=None):
+            return [{'batch_id': 'balance_sheet_1'}]
+
+    class BatchExtractor:
+        def __init__(self, extractor):
+            self.total_cost = total_cost
+
+        def extract_batch(self, batch):
+            return {'statement_type': 'balance_sheet', 'extracted_data': extracted_items}
+
+    module.DocumentStructureAnalyzer = DocumentStructureAnalyzer
+    module.BatchExtractor = BatchExtractor
+    return module
+
+
+class TestBatchExtraction:
+    """Test cases for PDFProcessor.process_with_batch_extraction"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.extractor = Mock()
+        self.extractor._load_template_fields.return_value = []
+        self.processor = PDFProcessor(extractor=self.extractor)
+        self.selected_pages = [
+            {'page_num': 3, 'statement_type': 'balance_sheet', 'image': object()},
+            {'page_num': 4, 'statement_type': 'balance_sheet', 'image': object()},
+        ]
+        self.items = [
+            {'page_num': 3, 'field_name': 'Cash and Cash Equivalents', 'value': 100, 'year': '2024', 'confidence': 0.9},
+            {'page_num': 4, 'field_name': 'Total Assets', 'value': 500, 'year': '2024', 'confidence': 0.8},
+        ]
+
+    def _run(self, year_data):
+        module = _fake_batch_processor_module(self.items)
+        with patch.dict(sys.modules, {'core.batch_processor': module}), \
+             patch.object(PDFProcessor, '_extract_years_from_financial_pages', return_value=year_data):
+            return self.processor.process_with_batch_extraction(self.selected_pages)
+
+    def test_year_and_cost_metadata_added(self):
+        """Test Year mapping and cost metadata are attached to the combined result"""
+        result = self._run({'years': ['2024', '2023'], 'confidence': 0.9, 'source': 'test'})
+
+        mappings = result['template_mappings']
+        assert mappings['Cash and Cash Equivalents']['value'] == 100
+        assert mappings['Total Assets']['value'] == 500
+        assert mappings['Year'] == {
+            'value': '2024',
+            'confidence': 0.9,
+            'Value_Year_1': '2024',
+            'Value_Year_2': '2023',
+            'Value_Year_3': None,
+            'Value_Year_4': None,
+            'source': 'test'
+        }
+
+        metadata = result['batch_processing_metadata']
+        assert metadata['total_batches'] == 1
+        assert metadata['total_pages'] == 2
+        assert metadata['total_cost'] == pytest.approx(0.3)
+        assert metadata['cost_per_page'] == pytest.approx(0.15)
+        assert metadata['processing_method'] == 'batch_extraction'
+
+    def test_diagnostics_written_in_order(self, capsys):
+        """Test buffered diagnostics still reach stdout in processing order"""
+        self._run({'years': ['2024'], 'confidence': 0.9, 'source': 'test'})
+
+        output = capsys.readouterr().out
+        field_line = output.index("[FIELD_MAP] Page 3: 'Cash and Cash Equivalents' = 100")
+        analysis = output.index("[FIELD_MAP] FIELD NAME MAPPING ANALYSIS")
+        cost_line = output.index("[INFO] Cost metadata added: $0.30 for 1 batches, 2 pages")
+        assert field_line < analysis < cost_line
+
+    def test_diagnostics_flushed_when_batch_fails(self, capsys):
+        """Test lines buffered before a failing item are still written"""
+        self.items[1]['confidence'] = 'high'
+        with patch.object(PDFProcessor, 'process_pages_sequentially', return_value={}) as mock_sequential:
+            self._run({'years': ['2024'], 'confidence': 0.9, 'source': 'test'})
+
+        output = capsys.readouterr().out
+        field_line = output.index("[FIELD_MAP] Page 3: 'Cash and Cash Equivalents' = 100")
+        error_line = output.index("[ERROR] Batch extraction failed")
+        assert field_line < error_line
+        mock_sequential.assert_called_once_with(self.selected_pages)
+
+    def test_no_year_data(self):
+        """Test that missing year data leaves the Year mapping out"""
+        result = self._run({'years': [], 'confidence': 0.0, 'source': 'vision_extraction'})
+
+        assert 'Year' not in result['template_mappings']
+        assert 'batch_processing_metadata' in result
+
+
+class TestBuildYearMapping:
+    """Test cases for PDFProcessor._build_year_mapping"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.processor = PDFProcessor(extractor=Mock())
+
+    def test_pads_missing_years(self):
+        """Test that fewer than four years are padded with None"""
+        mapping = self.processor._build_year_mapping({'years': ['2024']})
+
+        assert mapping['value'] == '2024'
+        assert mapping['confidence'] == 0.95
+        assert mapping['source'] == 'vision_extraction'
+        assert [mapping[f'Value_Year_{i}'] for i in range(1, 5)] == ['2024', None, None, None]
+
+    def test_truncates_extra_years(self):
+        """Test that only the four most recent years are mapped"""
+        mapping = self.processor._build_year_mapping({'years': ['2024', '2023', '2022', '2021', '2020']})
+
+        assert [mapping[f'Value_Year_{i}'] for i in range(1, 5)] == ['2024', '2023', '2022', '2021']
+        assert 'Value_Year_5' not in mapping
+
+
+class TestExtractYearsFromFinancialPages:
+    """Test cases for PDFProcessor._extract_years_from_financial_pages"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.extractor = Mock()
+        self.extractor.encode_image.side_effect = lambda image: f"b64:{image}"
+        self.extractor.extract_years_from_image.return_value = {'years': ['2024', '2023']}
+        self.processor = PDFProcessor(extractor=self.extractor)
+        self.financial_pages = [{'page_num': 200, 'statement_type': 'balance_sheet'}]
+
+    def test_accepts_sparse_dict(self):
+        """Test that page images keyed by page number are looked up directly"""
+        year_data = self.processor._extract_years_from_financial_pages({200: 'page200'}, self.financial_pages)
+
+        assert year_data['years'] == ['2024', '2023']
+        self.extractor.encode_image.assert_called_once_with('page200')
+
+    def test_skips_missing_dict_entry(self):
+        """Test that pages absent from the dict are skipped"""
+        year_data = self.processor._extract_years_from_financial_pages({}, self.financial_pages)
+
+        assert year_data['years'] == []
+        self.extractor.extract_years_from_image.assert_not_called()
+
+
+class TestStandardFormatConversion:
+    """Test cases for batch result format conversion"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.processor = PDFProcessor(extractor=Mock())
+        self.batch_results = [
+            {'page_num': 2, 'extracted_data': {'a': 1}, 'confidence': 0.7, 'statement_type': 'cash_flow'},
+            {}
+        ]
+
+    def test_convert_fills_defaults(self):
+        """Test conversion keeps values and fills defaults for missing keys"""
+        results = self.processor.convert_batch_results_to_standard_format(self.batch_results)
+
+        assert results == [
+            {'page_num': 2, 'extracted_data': {'a': 1}, 'confidence': 0.7,
+             'statement_type': 'cash_flow', 'batch_processed': True},
+            {'page_num': 0, 'extracted_data': {}, 'confidence': 0.0,
+             'statement_type': 'unknown', 'batch_processed': True}
+        ]
+
+    def test_iter_matches_list_conversion(self):
+        """Test the streaming variant is lazy and yields the same results"""
+        iterator = self.processor.iter_standard_format(iter(self.batch_results))
+
+        assert not isinstance(iterator, list)
+        assert list(iterator) == self.processor.convert_batch_results_to_standard_format(self.batch_results)
+
+
+def test_ascii_translate_matches_codec_sanitization():
+    """Test the translate table strips exactly what the ascii codec would ignore"""
+    message = "Erreur: fichier introuvable \u2013 \u00e9t\u00e9 \u2713 \U0001f4c4 done"
+
+    assert message.translate(_ASCII_TRANSLATE) == message.encode('ascii', errors='ignore').decode('ascii')
+
+
+class TestDisplayCostSummary:
+    """Test cases for PDFProcessor.display_cost_summary"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.processor = PDFProcessor(extractor=Mock())
+
+    def test_dict_metadata(self, capsys):
+        """Test summary from the JSON-friendly metadata dict"""
+        self.processor.display_cost_summary({
+            'batch_processing_metadata': {'total_batches': 2, 'total_pages': 10, 'total_cost': 1.0}
+        })
+
+        output = capsys.readouterr().out
+        assert "Total batches: 2" in output
+        assert "Total pages: 10" in output
+        assert "Cost per page: $0.100" in output
+
+    def test_legacy_list_metadata(self, capsys):
+        """Test summary aggregated across legacy per-batch results"""
+        self.processor.display_cost_summary([
+            {'processing_metadata': {'cost': 0.5, 'pages_processed': [1, 2]}},
+            {'processing_metadata': {'cost': 0.25, 'pages_processed': [3]}},
+            {'page_num': 4},
+            'not a dict'
+        ])
+
+        output = capsys.readouterr().out
+        assert "Total batches: 2" in output
+        assert "Total pages: 3" in output
+        assert "Total cost: $0.75" in output
+
+
+class TestLazyInitialization:
+    """Test cases for deferred PDFProcessor setup"""
+
+    def test_extractor_created_on_first_use(self):
+        """Test the default extractor is only built when first accessed"""
+        with patch('core.pdf_processor.FinancialDataExtractor') as mock_extractor_cls:
+            processor = PDFProcessor()
+            mock_extractor_cls.assert_not_called()
+
+            extractor = processor.extractor
+            assert processor.extractor is extractor
+            mock_extractor_cls.assert_called_once_with()
+
+    def test_injected_extractor_used(self):
+        """Test an injected extractor is used without building a default one"""
+        injected = Mock()
+        with patch('core.pdf_processor.FinancialDataExtractor') as mock_extractor_cls:
+            processor = PDFProcessor(extractor=injected)
+
+            assert processor.extractor is injected
+            mock_extractor_cls.assert_not_called()
+
+
+class TestClassifyPagesWithVision:
+    """Test cases for PDFProcessor.classify_pages_with_vision"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.extractor = Mock()
+        self.extractor.encode_image.side_effect = lambda image: image
+        self.processor = PDFProcessor(extractor=self.extractor)
+
+    def test_results_keep_page_order(self):
+        """Test concurrently scored pages are reported in page order and failures skipped"""
+        scores = {
+            'p0': {'balance_sheet': 90, 'income_statement': 10, 'cash_flow': 5, 'equity_statement': 0},
+            'p1': {'balance_sheet': 10, 'income_statement': 20, 'cash_flow': 5, 'equity_statement': 0},
+            'p3': {'balance_sheet': 5, 'income_statement': 10, 'cash_flow': 85, 'equity_statement': 0},
+        }
+
+        def classify(base64_image, page_num=None):
+            if base64_image == 'p2':
+                raise RuntimeError("API error")
+            return scores[base64_image]
+
+        with patch.object(PDFProcessor, '_classify_page_four_scores', side_effect=classify):
+            pages = self.processor.classify_pages_with_vision(['p0', 'p1', 'p2', 'p3'])
+
+        assert [(page['page_num'], page['statement_type']) for page in pages] == [(0, 'balance_sheet'), (3, 'cash_flow')]
+        assert pages[1]['confidence'] == pytest.approx(0.85)
+        assert pages[1]['image'] == 'p3'
+
+    def test_no_pages(self):
+        """Test an empty page list returns no financial pages"""
+        assert self.processor.classify_pages_with_vision([]) == []
+
+    def test_calls_go_through_rate_limiter(self):
+        """Test every page acquires a slot from the processor's classification rate limiter"""
+        scores = {'balance_sheet': 0, 'income_statement': 0, 'cash_flow': 0, 'equity_statement': 0}
+        limiter = Mock()
+        self.processor.classification_rate_limiter = limiter
+        with patch.object(PDFProcessor, '_classify_page_four_scores', return_value=scores) as mock_classify:
+            self.processor.classify_pages_with_vision(['p0', 'p1', 'p2'])
+
+        assert limiter.acquire.call_count == 3
+        assert sorted(call.kwargs['page_num'] for call in mock_classify.call_args_list) == [1, 2, 3]
+
+    def test_rate_limiter_shared_across_calls(self):
+        """Test repeated classification calls reuse one limiter built from the classification limit"""
+        from core.parallel_extractor import CLASSIFICATION_RATE_LIMIT
+        scores = {'balance_sheet': 0, 'income_statement': 0, 'cash_flow': 0, 'equity_statement': 0}
+        with patch.object(PDFProcessor, '_classify_page_four_scores', return_value=scores):
+            self.processor.classify_pages_with_vision(['p0'])
+            limiter = self.processor.classification_rate_limiter
+            self.processor.classify_pages_with_vision(['p0', 'p1'])
+
+        assert self.processor.classification_rate_limiter is limiter
+        assert limiter.max_requests == CLASSIFICATION_RATE_LIMIT
+        assert len(limiter.requests) == 3
+
+
+class TestConvertPdfToImages:
+    """Test cases for PDFProcessor.convert_pdf_to_images"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.processor = PDFProcessor(extractor=Mock())
+
+    def test_rasterizes_then_extracts_text(self):
+        """Test conversion is rasterization followed by text extraction on the same images"""
+        page_info = [{'page_num': 1, 'text': 'balance sheet'}]
+        with patch.object(PDFProcessor, '_rasterize_pdf', return_value=['img1']) as mock_rasterize, \
+             patch.object(PDFProcessor, '_extract_text_from_images', return_value=page_info) as mock_extract:
+            images, info = self.processor.convert_pdf_to_images(b'%PDF', enable_parallel=False)
+
+        assert images == ['img1']
+        assert info == page_info
+        mock_rasterize.assert_called_once_with(b'%PDF')
+        mock_extract.assert_called_once_with(['img1'], False)
+
+    def test_text_extraction_error_wrapped(self):
+        """Test text extraction failures keep the conversion error message"""
+        with patch.object(PDFProcessor, '_rasterize_pdf', return_value=['img1']), \
+             patch.object(PDFProcessor, '_extract_text_from_images', side_effect=RuntimeError("vision down")):
+            with pytest.raises(Exception, match="Error converting PDF to images: vision down"):
+                self.processor.convert_pdf_to_images(b'%PDF')
+
+
+class TestClassifyPagesWithVisionBatch:
+    """Test cases for PDFProcessor.classify_pages_with_vision_batch"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.extractor = Mock()
+        self.extractor.encode_image.side_effect = lambda image: image
+        self.processor = PDFProcessor(extractor=self.extractor)
+
+    def test_batch_size_controls_api_calls(self):
+        """Test pages are sent in batches of the requested size"""
+        def classify_batch(encoded_images):
+            return [{'balance_sheet': 80, 'income_statement': 0, 'cash_flow': 0, 'equity_statement': 0}
+                    for _ in encoded_images]
+
+        with patch.object(PDFProcessor, '_classify_batch_four_scores', side_effect=classify_batch) as mock_batch:
+            pages = self.processor.classify_pages_with_vision_batch(['p0', 'p1', 'p2'], batch_size=2)
+
+        assert [len(call.args[0]) for call in mock_batch.call_args_list] == [2, 1]
+        assert [page['page_num'] for page in pages] == [0, 1, 2]